@@ -1,10 +1,22 @@
 import re
 import logging
-from typing import Dict, List, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Pattern, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def _keyword_pattern(keywords: Iterable[str], overlapping: bool = False) -> Pattern[str]:
+    """Compile keywords into one alternation that matches any of them as a substring
+
+    Longest keywords come first so the reported match is the most specific one.
+    With overlapping=True the alternation sits in a lookahead, so findall()
+    reports keywords that share characters, e.g. 'conversational ai' and
+    'ai assistant'.
+    """
+    alternation = '|'.join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+    return re.compile(f'(?=({alternation}))' if overlapping else alternation)
+
+
 class AIContentFilter:
     """Filter content to ensure it's AI-related"""
     
@@ -86,6 +98,53 @@ class AIContentFilter:
         'research', 'development', 'innovation', 'technology'
     }
     
+    # Feeds whose items are always AI-related
+    AI_SPECIFIC_FEEDS: FrozenSet[str] = frozenset({
+        'Science Daily AI', 'Daily AI', 'MarkTechPost',
+        'AI News - Artificial Intelligence News',
+        'BAIR Blog - Berkeley AI Research', 'AI Business',
+        'The AI Daily Brief', 'AI News in 5 Minutes or Less',
+        'AI Lawyer Talking Tech', 'The Neuron',
+        'Analytics India Magazine', 'MIT News - Artificial Intelligence',
+        'VentureBeat AI', 'TechCrunch AI', 'The Verge AI',
+        'Ars Technica AI', 'Engadget AI', 'OpenAI Blog',
+        'Google AI Blog', 'DeepMind Blog'
+    })
+
+    # Nintendo, gaming accessories, non-AI hardware
+    STRONG_EXCLUDE_TERMS: FrozenSet[str] = frozenset({
+        'nintendo switch', 'switch 2', 'gaming controller', 'gaming case',
+        'gaming charger', 'gaming accessories', 'best nintendo',
+        'food delivery', 'delivery startup', 'matter update',
+        'smart home standard', 'keyless entry', 'car security'
+    })
+
+    # Title terms marking legal/privacy news that needs a strong AI signal
+    LEGAL_PRIVACY_KEYWORDS: FrozenSet[str] = frozenset({
+        'lawsuit', 'jury', 'illegally', 'privacy violation',
+        'data breach', 'court rules', 'legal battle',
+        'privacy concerns'
+    })
+
+    # AI companies that make a title AI-related on their own
+    AI_COMPANIES: FrozenSet[str] = frozenset({
+        'openai', 'anthropic', 'deepmind', 'stability ai',
+        'midjourney', 'character.ai', 'inflection ai',
+        'adept ai', 'cohere', 'ai21 labs'
+    })
+
+    # "AI" mentioned only in parentheses, e.g. "CyberPad (AI Integration)"
+    PARENTHESIZED_AI: Pattern[str] = re.compile(r'\(ai[^)]*\)')
+
+    # One scan of the text per keyword group instead of one `in` test per keyword
+    _PRIMARY_RE = _keyword_pattern(PRIMARY_AI_KEYWORDS)
+    _SECONDARY_RE = _keyword_pattern(SECONDARY_AI_KEYWORDS, overlapping=True)
+    _CONTEXT_RE = _keyword_pattern(CONTEXT_KEYWORDS)
+    _STRONG_CONTEXT_RE = _keyword_pattern(REQUIRES_STRONG_CONTEXT)
+    _STRONG_EXCLUDE_RE = _keyword_pattern(STRONG_EXCLUDE_TERMS)
+    _LEGAL_PRIVACY_RE = _keyword_pattern(LEGAL_PRIVACY_KEYWORDS)
+    _AI_COMPANY_RE = _keyword_pattern(AI_COMPANIES)
+
     @classmethod
     def is_ai_related(cls, item: Dict[str, str]) -> bool:
         """
@@ -102,19 +161,7 @@ class AIContentFilter:
         full_text = f"{title} {description}"
         
         # Priority check: Some feeds are always AI-related
-        ai_specific_feeds = {
-            'Science Daily AI', 'Daily AI', 'MarkTechPost',
-            'AI News - Artificial Intelligence News',
-            'BAIR Blog - Berkeley AI Research', 'AI Business',
-            'The AI Daily Brief', 'AI News in 5 Minutes or Less',
-            'AI Lawyer Talking Tech', 'The Neuron',
-            'Analytics India Magazine', 'MIT News - Artificial Intelligence',
-            'VentureBeat AI', 'TechCrunch AI', 'The Verge AI',
-            'Ars Technica AI', 'Engadget AI', 'OpenAI Blog',
-            'Google AI Blog', 'DeepMind Blog'
-        }
-        
-        if item.get('feed_name') in ai_specific_feeds:
+        if item.get('feed_name') in cls.AI_SPECIFIC_FEEDS:
             logger.debug(f"Including '{item.get('title')}' - from AI-specific feed")
             return True
         
@@ -125,30 +172,19 @@ class AIContentFilter:
                 return False
         
         # Additional exclusion: Nintendo, gaming accessories, non-AI hardware
-        strong_exclude_terms = {
-            'nintendo switch', 'switch 2', 'gaming controller', 'gaming case',
-            'gaming charger', 'gaming accessories', 'best nintendo',
-            'food delivery', 'delivery startup', 'matter update',
-            'smart home standard', 'keyless entry', 'car security'
-        }
-        if any(term in full_text for term in strong_exclude_terms):
+        if cls._STRONG_EXCLUDE_RE.search(full_text):
             logger.debug(f"Excluding '{item.get('title')}' - contains strong exclusion term")
             return False
         
         # Additional check: If "AI" appears only in parentheses or as a minor feature, skip
-        if re.search(r'\(ai[^)]*\)', title) and not any(kw in title for kw in cls.PRIMARY_AI_KEYWORDS):
+        if cls.PARENTHESIZED_AI.search(title) and not cls._PRIMARY_RE.search(title):
             logger.debug(f"Excluding '{item.get('title')}' - AI only mentioned as minor feature")
             return False
         
         # Check if it's primarily about legal/privacy issues with only passing AI mention
-        legal_privacy_keywords = {
-            'lawsuit', 'jury', 'illegally', 'privacy violation',
-            'data breach', 'court rules', 'legal battle',
-            'privacy concerns'
-        }
-        if any(kw in title.lower() for kw in legal_privacy_keywords):
+        if cls._LEGAL_PRIVACY_RE.search(title):
             # If title is about legal issues, require stronger AI presence
-            if not any(kw in title for kw in cls.PRIMARY_AI_KEYWORDS):
+            if not cls._PRIMARY_RE.search(title):
                 logger.debug(
                     f"Excluding '{item.get('title')}' - "
                     "primarily legal/privacy news with weak AI connection"
@@ -158,30 +194,19 @@ class AIContentFilter:
         # Stage 2: Check for primary AI keywords in title or early description
         title_and_early_desc = title + " " + description[:200]
         
-        primary_matches = []
-        for keyword in cls.PRIMARY_AI_KEYWORDS:
-            if keyword in title_and_early_desc:
-                primary_matches.append(keyword)
-        
-        if primary_matches:
-            logger.debug(f"Including '{item.get('title')}' - primary AI keywords in title/early desc: {primary_matches}")
+        primary_match = cls._PRIMARY_RE.search(title_and_early_desc)
+        if primary_match:
+            logger.debug(f"Including '{item.get('title')}' - primary AI keyword in title/early desc: {primary_match.group()}")
             return True
         
         # Stage 3: Check for strong context phrases
-        context_matches = []
-        for phrase in cls.CONTEXT_KEYWORDS:
-            if phrase in full_text:
-                context_matches.append(phrase)
-        
-        if context_matches:
-            logger.debug(f"Including '{item.get('title')}' - strong AI context: {context_matches}")
+        context_match = cls._CONTEXT_RE.search(full_text)
+        if context_match:
+            logger.debug(f"Including '{item.get('title')}' - strong AI context: {context_match.group()}")
             return True
         
         # Stage 4: Check secondary keywords (need multiple or with context)
-        secondary_matches = []
-        for keyword in cls.SECONDARY_AI_KEYWORDS:
-            if keyword in full_text:
-                secondary_matches.append(keyword)
+        secondary_matches = sorted(set(cls._SECONDARY_RE.findall(full_text)))
         
         # Need at least 2 secondary keywords
         if len(secondary_matches) >= 2:
@@ -189,24 +214,18 @@ class AIContentFilter:
             return True
         
         # Stage 5: Check if topics that require strong context have AI mentions
-        has_context_topic = any(topic in full_text for topic in cls.REQUIRES_STRONG_CONTEXT)
+        has_context_topic = cls._STRONG_CONTEXT_RE.search(full_text) is not None
         if has_context_topic and secondary_matches:
             # Has a context-requiring topic AND at least one AI keyword
             logger.debug(f"Including '{item.get('title')}' - context topic with AI keyword: {secondary_matches}")
             return True
         
         # Stage 6: Special case - check for AI company/product as main subject
-        ai_companies = {
-            'openai', 'anthropic', 'deepmind', 'stability ai',
-            'midjourney', 'character.ai', 'inflection ai',
-            'adept ai', 'cohere', 'ai21 labs'
-        }
-        
         # Check if AI company is in title (strong signal)
-        for company in ai_companies:
-            if company in title:
-                logger.debug(f"Including '{item.get('title')}' - AI company in title: {company}")
-                return True
+        company_match = cls._AI_COMPANY_RE.search(title)
+        if company_match:
+            logger.debug(f"Including '{item.get('title')}' - AI company in title: {company_match.group()}")
+            return True
         
         # Not AI-related
         logger.debug(f"Excluding '{item.get('title')}' - failed all AI relevance checks")
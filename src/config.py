@@ -1,5 +1,6 @@
 import os
-from typing import List, Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -19,6 +20,8 @@ class Config:
     # Google Cloud Configuration
     GCP_PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT", "")
     FIRESTORE_COLLECTION = os.getenv("FIRESTORE_COLLECTION", "processed_items")
+    PROCESSED_CACHE_PATH = os.getenv("PROCESSED_CACHE_PATH", "/tmp/processed_urls.json")  # Warm-instance cache
+    PROCESSED_CACHE_DAYS = 14  # Drop locally cached URLs after this many days
 
     # Environment
     ENVIRONMENT = os.getenv("ENVIRONMENT", "production")
@@ -114,6 +117,9 @@ class Config:
     MAX_RETRIES = 2  # Reduced retries for faster execution
     RETRY_DELAY = 1  # seconds
     REQUEST_TIMEOUT = 15  # seconds (balanced timeout)
+    FEED_CACHE_PATH = os.getenv("FEED_CACHE_PATH", "/tmp/rss_feed_cache.json")  # ETag/Last-Modified cache
+    ARTICLE_CACHE_PATH = os.getenv("ARTICLE_CACHE_PATH", "/tmp/article_cache.sqlite3")  # Extracted text + validators
+    ARTICLE_CACHE_DAYS = 7  # Drop cached articles after this many days
 
     # Summarization Configuration
     SUMMARY_BULLET_POINTS = 5  # Number of bullet points for summaries
@@ -142,6 +148,11 @@ class Config:
         return all(results.values())
 
     @classmethod
-    def get_all_feeds(cls) -> List[Dict[str, str]]:
-        """Get all configured RSS feeds"""
-        return cls.NEWS_FEEDS + cls.PODCAST_FEEDS
\ No newline at end of file
+    @lru_cache(maxsize=1)
+    def get_all_feeds(cls) -> Tuple[Dict[str, str], ...]:
+        """Get all configured RSS feeds
+
+        Built once per process; call get_all_feeds.cache_clear() after
+        changing NEWS_FEEDS or PODCAST_FEEDS.
+        """
+        return tuple(cls.NEWS_FEEDS) + tuple(cls.PODCAST_FEEDS)
\ No newline at end of file
@@ -29,6 +29,11 @@ class EventDrivenSummarizer:
         self.llm_client = LLMClient()
         self.db_client = FirestoreClient()
         self.digest = SlackDigest()
+
+    def close(self) -> None:
+        """Release the clients' connections"""
+        self.web_scraper.close()
+        self.digest.close()
         
     def check_for_new_episodes(self) -> List[Dict[str, Any]]:
         """Check podcast feeds for new episodes"""
@@ -182,6 +187,7 @@ def event_driven_function(cloud_event: Any) -> None:
     Can be triggered frequently (e.g., every 30 minutes) with minimal cost
     """
     start_time = time.time()
+    summarizer: Optional[EventDrivenSummarizer] = None
     
     try:
         logger.info("Event-driven check started")
@@ -217,6 +223,9 @@ def event_driven_function(cloud_event: Any) -> None:
         else:
             logger.info("No digest needed at this time")
         
+        # Persist the processed-URL cache once for the whole run
+        summarizer.db_client.flush()
+
         elapsed = time.time() - start_time
         logger.info(f"Event-driven check completed in {elapsed:.1f}s")
         
@@ -225,6 +234,9 @@ def event_driven_function(cloud_event: Any) -> None:
         error_client = error_reporting.Client()
         error_client.report_exception()
         raise
+    finally:
+        if summarizer is not None:
+            summarizer.close()
 
 
 @functions_framework.cloud_event
@@ -261,6 +273,8 @@ def podcast_check_function(cloud_event: Any) -> None:
         
         if not new_episodes_found:
             logger.info("No new episodes found")
+
+        db_client.flush()
             
     except Exception as e:
         logger.error(f"Podcast check error: {e}")
@@ -1,6 +1,8 @@
 from google.cloud import firestore
 from google.api_core import exceptions
+import json
 import logging
+import time
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 
@@ -17,6 +19,42 @@ class FirestoreClient:
         self.db = firestore.Client(project=Config.GCP_PROJECT_ID)
         self.collection = self.db.collection(self.collection_name)
 
+        # Local cache of URLs known to be processed ({url: unix timestamp}).
+        # Kept in /tmp so warm instances skip Firestore reads for repeat URLs.
+        self.cache_path = Config.PROCESSED_CACHE_PATH
+        self._processed: Dict[str, float] = self._load_processed_cache()
+        self._cache_dirty = False
+
+    def _load_processed_cache(self) -> Dict[str, float]:
+        """Load the local processed-URL cache, dropping expired entries"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+
+        cutoff = time.time() - Config.PROCESSED_CACHE_DAYS * 86400
+        return {url: ts for url, ts in data.items() if isinstance(ts, (int, float)) and ts >= cutoff}
+
+    def _remember_processed(self, url: str) -> None:
+        """Record a processed URL locally; flush() persists the cache"""
+        self._processed[url] = time.time()
+        self._cache_dirty = True
+
+    def flush(self) -> None:
+        """Write the local processed-URL cache once per run, if it changed"""
+        if not self._cache_dirty:
+            return
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._processed, f)
+            self._cache_dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write processed URL cache {self.cache_path}: {e}")
+
     def _get_document_id(self, url: str) -> str:
         """Generate a valid Firestore document ID from URL"""
         # Firestore document IDs have restrictions, so we'll use a hash
@@ -30,11 +68,18 @@ class FirestoreClient:
 
     def is_url_processed(self, url: str) -> bool:
         """Check if URL has already been processed"""
+        # Positive hits are final; misses still go to Firestore as the source of truth
+        if url in self._processed:
+            return True
+
         try:
             doc_id = self._get_document_id(url)
             doc_ref = self.collection.document(doc_id)
             doc = doc_ref.get()
-            return bool(doc.exists)
+            if doc.exists:
+                self._remember_processed(url)
+                return True
+            return False
 
         except exceptions.NotFound:
             return False
@@ -61,6 +106,7 @@ class FirestoreClient:
                 })
 
             self.collection.document(doc_id).set(doc_data)
+            self._remember_processed(url)
             logger.info(f"Marked URL as processed: {url}")
             return True
 
@@ -81,7 +127,8 @@ class FirestoreClient:
 
     def batch_check_urls(self, urls: List[str]) -> Dict[str, bool]:
         """Check multiple URLs at once for efficiency"""
-        results = {}
+        results = {url: True for url in urls if url in self._processed}
+        urls = [url for url in urls if url not in results]
 
         # Firestore has a limit of 10 for 'in' queries
         batch_size = 10
@@ -99,6 +146,8 @@ class FirestoreClient:
 
                 for url, doc_id in zip(batch_urls, doc_ids):
                     results[url] = doc_id in existing_ids
+                    if results[url]:
+                        self._remember_processed(url)
 
             except Exception as e:
                 logger.error(f"Error in batch URL check: {e}")
@@ -1,7 +1,8 @@
+import httpx
 import openai
 import logging
 import time
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 
 from .config import Config
 from .rate_limiter import rate_limit
@@ -9,6 +10,9 @@ from .circuit_breaker import circuit_breaker
 
 logger = logging.getLogger(__name__)
 
+# Connections kept open to OpenRouter; requests are sequential, so a small pool suffices
+LLM_POOL_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+
 
 class LLMClient:
     """OpenRouter LLM client for content summarization and AI tip generation"""
@@ -17,9 +21,21 @@ class LLMClient:
         self.client = openai.OpenAI(
             base_url=Config.OPENROUTER_BASE_URL,
             api_key=Config.OPENROUTER_API_KEY,
+            # One pooled HTTP client reused by every request this instance makes
+            http_client=httpx.Client(limits=LLM_POOL_LIMITS, follow_redirects=True),
         )
         self.model = Config.OPENROUTER_MODEL
 
+    def close(self) -> None:
+        """Release pooled OpenRouter connections"""
+        self.client.close()
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def summarize_article(self, title: str, content: str) -> Optional[List[str]]:
         """Summarize article content into bullet points focusing on AI relevance"""
         if not content:
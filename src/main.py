@@ -1,10 +1,8 @@
 import json
 import logging
-import signal
 import time
-from typing import Any
+from typing import Any, Optional
 import functions_framework
-from google.cloud import error_reporting
 
 from .config import Config
 from .rss_parser import RSSParser
@@ -32,23 +30,13 @@ def main_function(cloud_event: Any) -> None:
     Returns:
         None (Cloud Functions don't require return for Pub/Sub triggers)
     """
-    # Set up timeout handler
+    # Stop starting new work once the deadline is near; checked at loop boundaries
     start_time = time.time()
     timeout_seconds = Config.FUNCTION_TIMEOUT - Config.GRACEFUL_SHUTDOWN_BUFFER
+    deadline = time.monotonic() + timeout_seconds
     
-    def timeout_handler(signum: int, frame: Any) -> None:
-        """Handle timeout signal gracefully"""
-        elapsed = time.time() - start_time
-        logger.warning(
-            f"Function timeout approaching after {elapsed:.1f}s. "
-            f"Initiating graceful shutdown..."
-        )
-        raise TimeoutError("Function timeout - graceful shutdown initiated")
-    
-    # Set timeout signal
-    signal.signal(signal.SIGALRM, timeout_handler)
-    signal.alarm(timeout_seconds)
-    
+    web_scraper: Optional[WebScraper] = None
+    slack_client: Optional[SlackClient] = None
     try:
         logger.info("AI News Summarizer Cloud Function started")
 
@@ -87,6 +75,12 @@ def main_function(cloud_event: Any) -> None:
         logger.info(f"Processing {len(all_items['news'])} news items")
         with ResourceGuard("news_processing", memory_threshold=80.0):
             for article in all_items['news']:
+                if time.monotonic() > deadline - 5:
+                    logger.warning(
+                        f"Deadline reached after {time.time() - start_time:.1f}s, "
+                        "skipping remaining news items"
+                    )
+                    break
                 try:
                     # Check if already processed
                     if db_client.is_url_processed(article['url']):
@@ -95,7 +89,10 @@ def main_function(cloud_event: Any) -> None:
 
                     # Fetch full article content
                     logger.info(f"Fetching article: {article['title']}")
-                    content = web_scraper.fetch_article_content(article['url'])
+                    content = web_scraper.fetch_article_content(
+                        article['url'],
+                        timeout=min(Config.REQUEST_TIMEOUT, max(0.1, deadline - time.monotonic()))
+                    )
 
                     if not content:
                         logger.warning(f"No content extracted for: {article['url']}")
@@ -127,6 +124,12 @@ def main_function(cloud_event: Any) -> None:
         logger.info(f"Processing {len(all_items['podcast'])} podcast items")
         with ResourceGuard("podcast_processing", memory_threshold=80.0):
             for episode in all_items['podcast']:
+                if time.monotonic() > deadline - 5:
+                    logger.warning(
+                        f"Deadline reached after {time.time() - start_time:.1f}s, "
+                        "skipping remaining podcast items"
+                    )
+                    break
                 try:
                     # Check if already processed
                     if db_client.is_url_processed(episode['url']):
@@ -173,6 +176,9 @@ def main_function(cloud_event: Any) -> None:
             logger.error(f"Error generating AI tip: {e}")
             stats['errors'] += 1
 
+        # Persist the processed-URL cache once for the whole run
+        db_client.flush()
+
         # Send daily footer with statistics
         slack_client.send_daily_footer(stats)
 
@@ -182,43 +188,32 @@ def main_function(cloud_event: Any) -> None:
 
         # Cloud Functions don't need to return status codes
         logger.info(f"AI News Summarizer completed successfully: {json.dumps(stats)}")
-        
-        # Cancel timeout alarm
-        signal.alarm(0)
 
-    except TimeoutError as e:
-        # Handle graceful timeout
-        logger.error(f"Function timeout: {e}")
-        elapsed_time = time.time() - start_time
-        logger.info(f"Processed {stats.get('news_count', 0)} news and {stats.get('podcast_count', 0)} podcasts before timeout at {elapsed_time:.1f}s")
-        
-        # Try to send partial results to Slack
-        try:
-            slack_client.send_daily_footer(stats)
-        except Exception:
-            pass
-            
-        # Cancel alarm and exit gracefully
-        signal.alarm(0)
-        return
-        
     except Exception as e:
         logger.error(f"Cloud Function handler error: {e}")
 
         # Try to send error notification to Slack
         try:
-            slack_client = SlackClient()
-            slack_client.send_error_notification(
-                error_type=type(e).__name__,
-                error_details=str(e)
-            )
+            with SlackClient() as slack:
+                slack.send_error_notification(
+                    error_type=type(e).__name__,
+                    error_details=str(e)
+                )
         except Exception:
             pass
 
-        # Report error to Google Cloud Error Reporting
-        error_client = error_reporting.Client()
-        error_client.report_exception()
+        # Report error to Google Cloud Error Reporting; imported here because
+        # it is slow to import, and skipped under test where there are no credentials
+        if Config.ENVIRONMENT != 'test':
+            from google.cloud import error_reporting
+            error_reporting.Client().report_exception()
         raise  # Re-raise to mark function execution as failed
+    finally:
+        # Release the article cache and webhook connections on every exit path
+        if web_scraper is not None:
+            web_scraper.close()
+        if slack_client is not None:
+            slack_client.close()
 
 
 # For local testing
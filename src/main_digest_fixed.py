@@ -1,7 +1,8 @@
+import asyncio
 import json
 import logging
 import time
-from typing import Any
+from typing import Any, Optional
 import functions_framework
 from google.cloud import error_reporting
 
@@ -33,6 +34,8 @@ def main_function_digest(cloud_event: Any) -> None:
     """
     start_time = time.time()
     
+    web_scraper: Optional[WebScraper] = None
+    digest: Optional[SlackDigest] = None
     try:
         logger.info("AI News Summarizer Cloud Function started (Digest Mode)")
         
@@ -78,7 +81,18 @@ def main_function_digest(cloud_event: Any) -> None:
         max_news = 5  # Limit to prevent timeout
         
         with ResourceGuard("news_processing", memory_threshold=80.0):
+            # Skip already processed URLs, then fetch the rest concurrently
+            pending = []
             for article in all_items['news'][:max_news]:
+                if db_client.is_url_processed(article['url']):
+                    logger.info(f"Skipping already processed URL: {article['url']}")
+                    continue
+                pending.append(article)
+            
+            logger.info(f"Fetching {len(pending)} articles")
+            contents = asyncio.run(web_scraper.fetch_many([article['url'] for article in pending])) if pending else {}
+            
+            for article in pending:
                 try:
                     # Check timeout
                     elapsed = time.time() - start_time
@@ -86,14 +100,7 @@ def main_function_digest(cloud_event: Any) -> None:
                         logger.warning(f"Approaching timeout after {elapsed:.1f}s, sending partial digest")
                         break
                     
-                    # Check if already processed
-                    if db_client.is_url_processed(article['url']):
-                        logger.info(f"Skipping already processed URL: {article['url']}")
-                        continue
-                    
-                    # Fetch full article content
-                    logger.info(f"Fetching article: {article['title']}")
-                    content = web_scraper.fetch_article_content(article['url'])
+                    content = contents.get(article['url'])
                     
                     if not content:
                         logger.warning(f"No content extracted for: {article['url']}")
@@ -197,6 +204,9 @@ def main_function_digest(cloud_event: Any) -> None:
             except Exception as e:
                 logger.error(f"Error generating tool spotlight: {e}")
         
+        # Persist the processed-URL cache once for the whole run
+        db_client.flush()
+
         # Send the complete digest
         logger.info(f"Sending daily digest to Slack (news: {news_processed}, podcasts: {podcasts_processed})")
         success = digest.send_digest()
@@ -216,11 +226,11 @@ def main_function_digest(cloud_event: Any) -> None:
         # Try to send error notification
         try:
             from .slack_client import SlackClient
-            slack = SlackClient()
-            slack.send_error_notification(
-                error_type=type(e).__name__,
-                error_details=str(e)
-            )
+            with SlackClient() as slack:
+                slack.send_error_notification(
+                    error_type=type(e).__name__,
+                    error_details=str(e)
+                )
         except Exception:
             pass
         
@@ -228,6 +238,12 @@ def main_function_digest(cloud_event: Any) -> None:
         error_client = error_reporting.Client()
         error_client.report_exception()
         raise  # Re-raise to mark function execution as failed
+    finally:
+        # Release the article cache and webhook connections on every exit path
+        if web_scraper is not None:
+            web_scraper.close()
+        if digest is not None:
+            digest.close()
 
 
 # For local testing
@@ -1,8 +1,7 @@
 import json
 import logging
-import signal
 import time
-from typing import Any
+from typing import Any, Optional
 import functions_framework
 from google.cloud import error_reporting
 
@@ -32,23 +31,13 @@ def main_function_digest(cloud_event: Any) -> None:
     Returns:
         None (Cloud Functions don't require return for Pub/Sub triggers)
     """
-    # Set up timeout handler
+    # Stop starting new work once the deadline is near; checked at loop boundaries
     start_time = time.time()
     timeout_seconds = Config.FUNCTION_TIMEOUT - Config.GRACEFUL_SHUTDOWN_BUFFER
+    deadline = time.monotonic() + timeout_seconds
     
-    def timeout_handler(signum: int, frame: Any) -> None:
-        """Handle timeout signal gracefully"""
-        elapsed = time.time() - start_time
-        logger.warning(
-            f"Function timeout approaching after {elapsed:.1f}s. "
-            f"Initiating graceful shutdown..."
-        )
-        raise TimeoutError("Function timeout - graceful shutdown initiated")
-    
-    # Set timeout signal
-    signal.signal(signal.SIGALRM, timeout_handler)
-    signal.alarm(timeout_seconds)
-    
+    web_scraper: Optional[WebScraper] = None
+    digest: Optional[SlackDigest] = None
     try:
         logger.info("AI News Summarizer Cloud Function started (Digest Mode)")
         
@@ -89,6 +78,12 @@ def main_function_digest(cloud_event: Any) -> None:
         logger.info(f"Processing {len(all_items['news'])} news items")
         with ResourceGuard("news_processing", memory_threshold=80.0):
             for article in all_items['news']:
+                if time.monotonic() > deadline - 5:
+                    logger.warning(
+                        f"Deadline reached after {time.time() - start_time:.1f}s, "
+                        "skipping remaining news items"
+                    )
+                    break
                 try:
                     # Check if already processed
                     if db_client.is_url_processed(article['url']):
@@ -97,7 +92,10 @@ def main_function_digest(cloud_event: Any) -> None:
                     
                     # Fetch full article content
                     logger.info(f"Fetching article: {article['title']}")
-                    content = web_scraper.fetch_article_content(article['url'])
+                    content = web_scraper.fetch_article_content(
+                        article['url'],
+                        timeout=min(Config.REQUEST_TIMEOUT, max(0.1, deadline - time.monotonic()))
+                    )
                     
                     if not content:
                         logger.warning(f"No content extracted for: {article['url']}")
@@ -129,6 +127,12 @@ def main_function_digest(cloud_event: Any) -> None:
         logger.info(f"Processing {len(all_items['podcast'])} podcast items")
         with ResourceGuard("podcast_processing", memory_threshold=80.0):
             for episode in all_items['podcast']:
+                if time.monotonic() > deadline - 5:
+                    logger.warning(
+                        f"Deadline reached after {time.time() - start_time:.1f}s, "
+                        "skipping remaining podcast items"
+                    )
+                    break
                 try:
                     # Check if already processed
                     if db_client.is_url_processed(episode['url']):
@@ -163,6 +167,9 @@ def main_function_digest(cloud_event: Any) -> None:
                     digest.increment_errors()
                     continue
         
+        # Persist the processed-URL cache once for the whole run
+        db_client.flush()
+
         # Send the complete digest
         logger.info("Sending daily digest to Slack")
         success = digest.send_digest()
@@ -176,25 +183,6 @@ def main_function_digest(cloud_event: Any) -> None:
         elapsed_time = time.time() - start_time
         logger.info(f"Processing complete in {elapsed_time:.1f}s. Stats: {json.dumps(digest.stats)}")
         
-        # Cancel timeout alarm
-        signal.alarm(0)
-        
-    except TimeoutError as e:
-        # Handle graceful timeout
-        logger.error(f"Function timeout: {e}")
-        elapsed_time = time.time() - start_time
-        
-        # Try to send partial digest
-        try:
-            logger.info(f"Attempting to send partial digest before timeout...")
-            digest.send_digest()
-        except Exception:
-            pass
-            
-        # Cancel alarm and exit gracefully
-        signal.alarm(0)
-        return
-        
     except Exception as e:
         logger.error(f"Cloud Function handler error: {e}")
         
@@ -202,6 +190,12 @@ def main_function_digest(cloud_event: Any) -> None:
         error_client = error_reporting.Client()
         error_client.report_exception()
         raise  # Re-raise to mark function execution as failed
+    finally:
+        # Release the article cache and webhook connections on every exit path
+        if web_scraper is not None:
+            web_scraper.close()
+        if digest is not None:
+            digest.close()
 
 
 # For local testing
@@ -1,6 +1,5 @@
 """Memory and performance monitoring utilities"""
 import os
-import psutil
 import logging
 import gc
 from typing import Dict, Any, Optional, Callable
@@ -9,6 +8,15 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# psutil is optional; without it monitoring degrades to no-ops
+try:
+    import psutil
+    HAVE_PSUTIL = True
+except ImportError:
+    psutil = None
+    HAVE_PSUTIL = False
+    logger.warning("psutil not available, memory monitoring disabled")
+
 
 class MemoryMonitor:
     """Monitor memory usage and prevent OOM errors"""
@@ -21,12 +29,23 @@ class MemoryMonitor:
             threshold_percent: Memory usage threshold percentage
         """
         self.threshold_percent = threshold_percent
-        self.process = psutil.Process(os.getpid())
+        self.process: Optional["psutil.Process"] = psutil.Process(os.getpid()) if HAVE_PSUTIL else None
         self.start_memory = self.get_memory_info()
+        if not HAVE_PSUTIL:
+            return
         logger.info(f"Memory monitor initialized. Start memory: {self.start_memory['rss_mb']:.1f} MB")
     
     def get_memory_info(self) -> Dict[str, Any]:
         """Get current memory usage information"""
+        if self.process is None:
+            return {
+                "rss_mb": 0,
+                "vms_mb": 0,
+                "percent": 0,
+                "available_mb": 0,
+                "timestamp": datetime.utcnow().isoformat()
+            }
+
         memory_info = self.process.memory_info()
         memory_percent = self.process.memory_percent()
         
@@ -58,6 +77,9 @@ class MemoryMonitor:
     
     def log_memory_stats(self, label: str = "") -> None:
         """Log current memory statistics"""
+        if not HAVE_PSUTIL:
+            return
+
         memory_info = self.get_memory_info()
         memory_delta = memory_info["rss_mb"] - self.start_memory["rss_mb"]
         
@@ -68,10 +90,22 @@ class MemoryMonitor:
         )
     
     def force_garbage_collection(self) -> None:
-        """Force garbage collection to free memory"""
+        """
+        Free memory via garbage collection, escalating only when needed
+
+        Skips collection while usage is well below the threshold, then tries a
+        cheap young-generation pass before falling back to a full collection.
+        """
         before = self.get_memory_info()
-        gc.collect()
+        if before["percent"] < self.threshold_percent * 0.7:
+            logger.debug(f"Skipping garbage collection at {before['percent']:.1f}% memory used")
+            return
+
+        gc.collect(0)
         after = self.get_memory_info()
+        if after["percent"] > self.threshold_percent:
+            gc.collect()
+            after = self.get_memory_info()
         
         freed = before["rss_mb"] - after["rss_mb"]
         if freed > 0:
@@ -89,6 +123,9 @@ def monitor_memory(threshold_percent: float = 80.0) -> Callable:
         Decorated function with memory monitoring
     """
     def decorator(func: Callable) -> Callable:
+        if not HAVE_PSUTIL:
+            return func
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             monitor = MemoryMonitor(threshold_percent)
@@ -133,7 +170,8 @@ class ResourceGuard:
         self,
         operation_name: str,
         memory_threshold: float = 85.0,
-        cleanup_on_exit: bool = True
+        cleanup_on_exit: bool = True,
+        cleanup_growth_mb: float = 50.0
     ) -> None:
         """
         Initialize resource guard
@@ -142,12 +180,15 @@ class ResourceGuard:
             operation_name: Name of the operation for logging
             memory_threshold: Memory usage threshold percentage
             cleanup_on_exit: Whether to force GC on exit
+            cleanup_growth_mb: Minimum RSS growth during the block before GC runs on exit
         """
         self.operation_name = operation_name
         self.memory_threshold = memory_threshold
         self.cleanup_on_exit = cleanup_on_exit
+        self.cleanup_growth_mb = cleanup_growth_mb
         self.monitor = MemoryMonitor(memory_threshold)
         self.start_time: Optional[float] = None
+        self.start_rss_mb = 0.0
     
     def __enter__(self) -> "ResourceGuard":
         """Enter resource-guarded context"""
@@ -156,6 +197,7 @@ class ResourceGuard:
         
         logger.info(f"Starting resource-intensive operation: {self.operation_name}")
         self.monitor.log_memory_stats("at start")
+        self.start_rss_mb = self.monitor.get_memory_info()["rss_mb"]
         
         # Check if we have enough memory
         if not self.monitor.check_memory_usage():
@@ -178,50 +220,6 @@ class ResourceGuard:
         )
         
         if self.cleanup_on_exit:
-            self.monitor.force_garbage_collection()
-
-
-# Try to import psutil, provide fallback if not available
-try:
-    import psutil
-except ImportError:
-    logger.warning("psutil not available, memory monitoring disabled")
-    
-    # Provide no-op implementations
-    class MemoryMonitor:  # type: ignore
-        def __init__(self, threshold_percent: float = 80.0) -> None:
-            pass
-        
-        def get_memory_info(self) -> Dict[str, Any]:
-            return {
-                "rss_mb": 0,
-                "vms_mb": 0,
-                "percent": 0,
-                "available_mb": 0,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        
-        def check_memory_usage(self) -> bool:
-            return True
-        
-        def log_memory_stats(self, label: str = "") -> None:
-            pass
-        
-        def force_garbage_collection(self) -> None:
-            gc.collect()
-    
-    def monitor_memory(threshold_percent: float = 80.0) -> Callable:
-        """No-op decorator when psutil not available"""
-        def decorator(func: Callable) -> Callable:
-            return func
-        return decorator
-    
-    class ResourceGuard:  # type: ignore
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
-        
-        def __enter__(self) -> "ResourceGuard":
-            return self
-        
-        def __exit__(self, *args: Any) -> None:
-            pass
\ No newline at end of file
+            growth = self.monitor.get_memory_info()["rss_mb"] - self.start_rss_mb
+            if growth > self.cleanup_growth_mb:
+                self.monitor.force_garbage_collection()
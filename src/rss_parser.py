@@ -1,7 +1,12 @@
 import feedparser
 import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
 import logging
-from typing import List, Dict, Optional
+import re
+from typing import List, Dict, Optional, Set
 from datetime import datetime, timedelta
 import time
 
@@ -10,41 +15,102 @@ from .rate_limiter import rate_limit
 
 logger = logging.getLogger(__name__)
 
+# Runs of whitespace in description text, collapsed to a single space
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class RSSParser:
     """Parse RSS feeds and extract relevant content"""
 
-    def __init__(self) -> None:
+    def __init__(self, cache_path: Optional[str] = None, max_retries: Optional[int] = None,
+                 backoff_factor: float = 0.5) -> None:
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'AI-News-Summarizer/1.0 (+https://github.com/yourusername/ai-slack-news)'
         })
 
+        # Pool connections per host and let urllib3 retry transient failures;
+        # tests pass backoff_factor=0 to retry without sleeping. max_retries
+        # counts attempts like Config.MAX_RETRIES, while urllib3's total
+        # counts retries after the first attempt.
+        self.max_retries = Config.MAX_RETRIES if max_retries is None else max_retries
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=Retry(
+                total=max(self.max_retries - 1, 0),
+                backoff_factor=backoff_factor,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Conditional-GET validators per feed URL; /tmp survives warm invocations
+        self.cache_path = cache_path or Config.FEED_CACHE_PATH
+        self.validators: Dict[str, Dict[str, str]] = self._load_validators()
+        self.unchanged_feeds: Set[str] = set()
+
+    def _load_validators(self) -> Dict[str, Dict[str, str]]:
+        """Load cached ETag/Last-Modified values from disk"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_validators(self) -> None:
+        """Persist ETag/Last-Modified values to disk"""
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self.validators, f)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write feed cache {self.cache_path}: {e}")
+
     @rate_limit('rss', calls_per_minute=60)
     def fetch_feed(self, feed_url: str, feed_name: str) -> Optional[feedparser.FeedParserDict]:
-        """Fetch and parse an RSS feed with retry logic"""
-        for attempt in range(Config.MAX_RETRIES):
-            try:
-                logger.info(f"Fetching RSS feed: {feed_name} ({feed_url})")
-                response = self.session.get(feed_url, timeout=Config.REQUEST_TIMEOUT)
-                response.raise_for_status()
-
-                feed = feedparser.parse(response.content)
-                if feed.bozo:
-                    logger.warning(f"Feed parsing warning for {feed_name}: {feed.bozo_exception}")
-
-                return feed
-
-            except requests.RequestException as e:
-                logger.error(f"Error fetching {feed_name} (attempt {attempt + 1}/{Config.MAX_RETRIES}): {e}")
-                if attempt < Config.MAX_RETRIES - 1:
-                    time.sleep(Config.RETRY_DELAY)
-                else:
-                    return None
-            except Exception as e:
-                logger.error(f"Unexpected error parsing {feed_name}: {e}")
+        """
+        Fetch and parse an RSS feed (retries are handled by the session adapter)
+
+        Sends If-None-Match/If-Modified-Since from the previous fetch and
+        returns None when the server answers 304 Not Modified.
+        """
+        try:
+            logger.info(f"Fetching RSS feed: {feed_name} ({feed_url})")
+            headers = {}
+            cached = self.validators.get(feed_url, {})
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+            response = self.session.get(feed_url, headers=headers, timeout=Config.REQUEST_TIMEOUT)
+            if response.status_code == 304:
+                logger.info(f"Feed unchanged since last fetch: {feed_name}")
+                self.unchanged_feeds.add(feed_url)
                 return None
-        return None
+            response.raise_for_status()
+
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.validators[feed_url] = {'etag': etag or '', 'last_modified': last_modified or ''}
+                self._save_validators()
+
+            feed = feedparser.parse(response.content)
+            if feed.bozo:
+                logger.warning(f"Feed parsing warning for {feed_name}: {feed.bozo_exception}")
+
+            return feed
+
+        except requests.RequestException as e:
+            logger.error(f"Error fetching {feed_name}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error parsing {feed_name}: {e}")
+            return None
 
     def extract_feed_items(self, feed: feedparser.FeedParserDict, feed_config: Dict[str, str],
                           hours_back: int = 24) -> List[Dict[str, str]]:
@@ -54,35 +120,35 @@ class RSSParser:
 
         for entry in feed.entries[:Config.MAX_ARTICLES_PER_FEED]:
             try:
-                # Parse publication date
-                pub_date = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    pub_date = datetime.fromtimestamp(time.mktime(entry.published_parsed))
-                elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                    pub_date = datetime.fromtimestamp(time.mktime(entry.updated_parsed))
+                # Resolve each field once; FeedParserDict lookups are not free
+                parsed_date = entry.get('published_parsed') or entry.get('updated_parsed')
+                title = entry.get('title') or 'No Title'
+                link = entry.get('link') or ''
+                description = entry.get('summary') or ''
+
+                # Only add items with valid URLs
+                if not link:
+                    continue
 
                 # Skip old items
+                pub_date = datetime.fromtimestamp(time.mktime(parsed_date)) if parsed_date else None
                 if pub_date and pub_date < cutoff_time:
                     continue
 
-                # Extract item data
-                item = {
-                    'title': entry.get('title', 'No Title'),
-                    'url': entry.get('link', ''),
-                    'description': self._clean_description(entry.get('summary', '')),
+                # For podcasts, try to get more detailed description
+                if feed_config['type'] == 'podcast':
+                    content = entry.get('content')
+                    if content:
+                        description = content[0].get('value', '')
+
+                items.append({
+                    'title': title,
+                    'url': link,
+                    'description': self._clean_description(description),
                     'published': pub_date.isoformat() if pub_date else datetime.now().isoformat(),
                     'feed_name': feed_config['name'],
                     'feed_type': feed_config['type']
-                }
-
-                # For podcasts, try to get more detailed description
-                if feed_config['type'] == 'podcast':
-                    if hasattr(entry, 'content') and entry.content:
-                        item['description'] = self._clean_description(entry.content[0].get('value', ''))
-
-                # Only add items with valid URLs
-                if item['url']:
-                    items.append(item)
+                })
 
             except Exception as e:
                 logger.error(f"Error processing feed entry in {feed_config['name']}: {e}")
@@ -95,14 +161,10 @@ class RSSParser:
         if not description:
             return ""
 
-        # Remove HTML tags using BeautifulSoup
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(description, 'html.parser')
-        text = soup.get_text()
-
-        # Clean whitespace
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        return ' '.join(lines)
+        # Join text nodes without a separator so inline tags don't add spaces
+        # ("<a>link</a>." stays "link."), then collapse whitespace
+        text = BeautifulSoup(description, 'lxml').get_text()
+        return _WHITESPACE_RE.sub(' ', text).strip()
 
     def fetch_all_feeds(self) -> Dict[str, List[Dict[str, str]]]:
         """Fetch all configured feeds and return categorized items"""
@@ -121,6 +183,8 @@ class RSSParser:
                 items = self.extract_feed_items(feed, feed_config, hours_back=hours_back)
                 all_items[feed_config['type']].extend(items)
                 logger.info(f"Extracted {len(items)} items from {feed_config['name']} (last {hours_back} hours)")
+            elif feed_config['url'] in self.unchanged_feeds:
+                logger.info(f"Skipping unchanged feed: {feed_config['name']}")
             else:
                 logger.warning(f"Failed to fetch feed: {feed_config['name']}")
 
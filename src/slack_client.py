@@ -1,12 +1,62 @@
-import requests
 import logging
-from typing import List, Dict, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Dict, Any
 
 from .config import Config
 from .security import sanitize_text_for_slack
 
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it encodes large block payloads much faster than json
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    import json
+    orjson = None  # type: ignore[assignment]
+    HAVE_ORJSON = False
+
+
+def create_webhook_session() -> "requests.Session":
+    """Create a keep-alive session for posting JSON to Slack webhooks"""
+    # requests is slow to import, so the Slack modules only import it to post
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+
+    session = Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    session.headers.update({'Content-Type': 'application/json'})
+    return session
+
+
+def encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a webhook payload to UTF-8 JSON bytes"""
+    if HAVE_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _section(text: str) -> Dict[str, Any]:
+    """Build a section block holding a single mrkdwn text object"""
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def _context(text: str) -> Dict[str, Any]:
+    """Build a context block holding a single mrkdwn element"""
+    return {"type": "context", "elements": [{"type": "mrkdwn", "text": text}]}
+
+
+# Static blocks reused by every message. They are shared, so never mutate them.
+_DIVIDER: Dict[str, Any] = {"type": "divider"}
+_NEWS_HEADING: Dict[str, Any] = _section("✨ *AI News Summary:*")
+_PODCAST_HEADING: Dict[str, Any] = _section("🎙️ *Podcast Digest:*")
+_TIP_HEADING: Dict[str, Any] = _section("⭐ *AI Tip of the Day!* ⭐")
+_ERROR_HEADING: Dict[str, Any] = _section("⚠️ *AI News Summarizer Error*")
+_HEADER_TAGLINE: Dict[str, Any] = _context("_Your daily dose of AI news, insights, and tips_")
+
 
 class SlackClient:
     """Send formatted messages to Slack using Block Kit"""
@@ -14,6 +64,23 @@ class SlackClient:
     def __init__(self) -> None:
         self.webhook_url = Config.SLACK_WEBHOOK_URL
 
+    @cached_property
+    def _session(self) -> "requests.Session":
+        """Keep-alive session so consecutive posts reuse one TLS connection"""
+        return create_webhook_session()
+
+    def close(self) -> None:
+        """Release pooled webhook connections"""
+        session = self.__dict__.pop('_session', None)
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> "SlackClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def send_news_summary(self, article: Dict[str, Any], summary: List[str]) -> bool:
         """Send a news article summary to Slack"""
         # Sanitize all text content
@@ -22,39 +89,11 @@ class SlackClient:
         safe_feed_name = sanitize_text_for_slack(article.get('feed_name', 'Unknown'))
 
         blocks: List[Dict[str, Any]] = [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"✨ *AI News Summary:*"
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*{safe_title}*"
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "\n".join([f"• {point}" for point in safe_summary])
-                }
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"📰 {safe_feed_name} | <{article['url']}|Read More>"
-                    }
-                ]
-            },
-            {
-                "type": "divider"
-            }
+            _NEWS_HEADING,
+            _section(f"*{safe_title}*"),
+            _section("• " + "\n• ".join(safe_summary) if safe_summary else ""),
+            _context(f"📰 {safe_feed_name} | <{article['url']}|Read More>"),
+            _DIVIDER
         ]
 
         return self._send_message(blocks=blocks)
@@ -62,39 +101,11 @@ class SlackClient:
     def send_podcast_summary(self, episode: Dict[str, Any], summary: List[str]) -> bool:
         """Send a podcast episode summary to Slack"""
         blocks: List[Dict[str, Any]] = [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"🎙️ *Podcast Digest:*"
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*{episode['title']}*"
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "\n".join([f"• {point}" for point in summary])
-                }
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"🎧 {episode['feed_name']} | <{episode['url']}|Listen Here>"
-                    }
-                ]
-            },
-            {
-                "type": "divider"
-            }
+            _PODCAST_HEADING,
+            _section(f"*{episode['title']}*"),
+            _section("• " + "\n• ".join(summary) if summary else ""),
+            _context(f"🎧 {episode['feed_name']} | <{episode['url']}|Listen Here>"),
+            _DIVIDER
         ]
 
         return self._send_message(blocks=blocks)
@@ -102,23 +113,9 @@ class SlackClient:
     def send_ai_tip(self, tip: str) -> bool:
         """Send AI Tip of the Day to Slack"""
         blocks: List[Dict[str, Any]] = [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"⭐ *AI Tip of the Day!* ⭐"
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": tip
-                }
-            },
-            {
-                "type": "divider"
-            }
+            _TIP_HEADING,
+            _section(tip),
+            _DIVIDER
         ]
 
         return self._send_message(blocks=blocks)
@@ -137,18 +134,8 @@ class SlackClient:
                     "emoji": True
                 }
             },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "_Your daily dose of AI news, insights, and tips_"
-                    }
-                ]
-            },
-            {
-                "type": "divider"
-            }
+            _HEADER_TAGLINE,
+            _DIVIDER
         ]
 
         return self._send_message(blocks=blocks)
@@ -156,15 +143,7 @@ class SlackClient:
     def send_daily_footer(self, stats: Dict[str, Any]) -> bool:
         """Send a footer with statistics"""
         blocks: List[Dict[str, Any]] = [
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"📊 _Today's digest: {stats.get('news_count', 0)} news articles, {stats.get('podcast_count', 0)} podcast episodes_"
-                    }
-                ]
-            }
+            _context(f"📊 _Today's digest: {stats.get('news_count', 0)} news articles, {stats.get('podcast_count', 0)} podcast episodes_")
         ]
 
         return self._send_message(blocks=blocks)
@@ -172,13 +151,7 @@ class SlackClient:
     def send_error_notification(self, error_type: str, error_details: str) -> bool:
         """Send error notification to Slack (for monitoring)"""
         blocks: List[Dict[str, Any]] = [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"⚠️ *AI News Summarizer Error*"
-                }
-            },
+            _ERROR_HEADING,
             {
                 "type": "section",
                 "fields": [
@@ -207,11 +180,12 @@ class SlackClient:
             "blocks": blocks
         }
 
+        from requests import RequestException
+
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
+                data=encode_payload(payload),
                 timeout=10
             )
 
@@ -222,20 +196,14 @@ class SlackClient:
                 logger.error(f"Failed to send to Slack: {response.status_code} - {response.text}")
                 return False
 
-        except requests.RequestException as e:
+        except RequestException as e:
             logger.error(f"Error sending to Slack: {e}")
             return False
 
     def test_connection(self) -> bool:
         """Test Slack webhook connection"""
         test_blocks = [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "🔧 *Test Message*\nAI News Summarizer webhook test successful!"
-                }
-            }
+            _section("🔧 *Test Message*\nAI News Summarizer webhook test successful!")
         ]
 
         return self._send_message(blocks=test_blocks, text="Test Message")
@@ -1,52 +1,26 @@
-import requests
-import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 from datetime import datetime
 
-from .config import Config
 from .security import sanitize_text_for_slack
+from .slack_client import _context, _section
+from .slack_digest_v2 import SlackDigest as _BaseDigest
+from .slack_digest_v2 import _DIVIDER, _PODCASTS_HEADING, _TIP_HEADING
 
-logger = logging.getLogger(__name__)
+# Static blocks reused by every digest. They are shared, so never mutate them.
+_PODCASTS_HEADING_ALT: Dict[str, Any] = _section("🎙️ *Today's AI Podcasts*")
+_FOOTER_CREDITS: Dict[str, Any] = _context("🤖 _Powered by AI News Summarizer_ • <https://github.com/NYMetsFan86/slack-ai-news-feed|View on GitHub>")
 
 
-class SlackDigest:
-    """Collect all daily content and send as a single digest message"""
-    
-    def __init__(self) -> None:
-        self.webhook_url = Config.SLACK_WEBHOOK_URL
-        self.blocks: List[Dict[str, Any]] = []
-        self.news_items: List[Dict[str, Any]] = []
-        self.podcast_items: List[Dict[str, Any]] = []
-        self.ai_tip: Optional[str] = None
-        self.stats: Dict[str, int] = {'news_count': 0, 'podcast_count': 0, 'errors': 0}
-    
-    def add_news_item(self, article: Dict[str, Any], summary: List[str]) -> None:
-        """Add a news item to the digest"""
-        self.news_items.append({
-            'article': article,
-            'summary': summary
-        })
-        self.stats['news_count'] += 1
-    
-    def add_podcast_item(self, episode: Dict[str, Any], summary: List[str]) -> None:
-        """Add a podcast episode to the digest"""
-        self.podcast_items.append({
-            'episode': episode,
-            'summary': summary
-        })
-        self.stats['podcast_count'] += 1
-    
-    def set_ai_tip(self, tip: str) -> None:
-        """Set the AI tip of the day"""
-        self.ai_tip = tip
-    
-    def increment_errors(self) -> None:
-        """Track error count"""
-        self.stats['errors'] += 1
+class SlackDigest(_BaseDigest):
+    """Original digest layout; collection and sending are shared with v2"""
     
     def build_digest(self) -> List[Dict[str, Any]]:
         """Build the complete digest message blocks"""
-        blocks = []
+        key = (len(self.news_items), len(self.podcast_items), self.ai_tip, self.stats['errors'])
+        if key == self._built_key and self._built is not None:
+            return self._built
+
+        blocks: List[Dict[str, Any]] = []
         
         # Header
         blocks.extend([
@@ -58,84 +32,33 @@ class SlackDigest:
                     "emoji": True
                 }
             },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"Your daily AI news roundup • {self.stats['news_count']} articles • {self.stats['podcast_count']} podcasts"
-                    }
-                ]
-            },
-            {"type": "divider"}
+            _context(f"Your daily AI news roundup • {self.stats['news_count']} articles • {self.stats['podcast_count']} podcasts"),
+            _DIVIDER
         ])
         
         # AI Tip of the Day (prominent at the top)
         if self.ai_tip:
             blocks.extend([
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"💡 *AI TIP OF THE DAY* 💡"
-                    }
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": sanitize_text_for_slack(self.ai_tip)
-                    }
-                },
-                {"type": "divider"}
+                _TIP_HEADING,
+                _section(sanitize_text_for_slack(self.ai_tip)),
+                _DIVIDER
             ])
         
         # Podcasts First (more prominent)
         if self.podcast_items:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "🎙️ *TODAY'S AI PODCASTS*"
-                }
-            })
+            blocks.append(_PODCASTS_HEADING)
             
-            for item in self.podcast_items[:3]:  # Limit to 3 podcasts
-                article = item['article']
-                summary = item['summary']
-                
-                safe_title = sanitize_text_for_slack(article.get('title', 'No Title'))
-                safe_summary = [sanitize_text_for_slack(point) for point in summary]
-                safe_feed = sanitize_text_for_slack(article.get('feed_name', 'Unknown'))
-                
-                blocks.extend([
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"*<{article.get('url', '#')}|{safe_title}>*\n_{safe_feed}_"
-                        }
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": "\n".join([f"• {point}" for point in safe_summary])
-                        }
-                    }
-                ])
+            blocks += [
+                block
+                for item in self.podcast_items[:3]  # Limit to 3 podcasts
+                for block in self._item_blocks(item['episode'], item['summary'])
+            ]
             
-            blocks.append({"type": "divider"})
+            blocks.append(_DIVIDER)
         
         # Podcasts
         if self.podcast_items:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "🎙️ *Today's AI Podcasts*"
-                }
-            })
+            blocks.append(_PODCASTS_HEADING_ALT)
             
             for item in self.podcast_items[:6]:  # Show up to 6 episodes (weekend catch-up)
                 episode = item['episode']
@@ -147,85 +70,17 @@ class SlackDigest:
                 duration = episode.get('duration', '')
                 
                 blocks.extend([
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"*<{episode.get('url', '#')}|{safe_title}>*\n_{safe_feed}_ {f'• {duration}' if duration else ''}"
-                        }
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": "\n".join([f"• {point}" for point in safe_summary])
-                        }
-                    }
+                    _section(f"*<{episode.get('url', '#')}|{safe_title}>*\n_{safe_feed}_ {f'• {duration}' if duration else ''}"),
+                    _section("• " + "\n• ".join(safe_summary) if safe_summary else "")
                 ])
             
-            blocks.append({"type": "divider"})
+            blocks.append(_DIVIDER)
         
         # Footer
         blocks.extend([
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"📊 Processed: {self.stats['news_count']} news articles, {self.stats['podcast_count']} podcasts • ⚠️ Errors: {self.stats['errors']}"
-                    }
-                ]
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "🤖 _Powered by AI News Summarizer_ • <https://github.com/NYMetsFan86/slack-ai-news-feed|View on GitHub>"
-                    }
-                ]
-            }
+            _context(f"📊 Processed: {self.stats['news_count']} news articles, {self.stats['podcast_count']} podcasts • ⚠️ Errors: {self.stats['errors']}"),
+            _FOOTER_CREDITS
         ])
         
-        return blocks  # type: ignore[return-value]
-    
-    def send_digest(self) -> bool:
-        """Send the complete digest to Slack"""
-        if not self.news_items and not self.podcast_items and not self.ai_tip:
-            logger.warning("No content to send in digest")
-            return False
-        
-        blocks = self.build_digest()
-        
-        # Slack has a limit of 50 blocks per message
-        if len(blocks) > 50:
-            logger.warning(f"Digest has {len(blocks)} blocks, truncating to 50")
-            blocks = blocks[:49] + [blocks[-1]]  # Keep footer
-        
-        payload = {
-            "blocks": blocks,
-            "text": f"AI Daily Digest - {self.stats['news_count']} articles, {self.stats['podcast_count']} podcasts"  # Fallback text
-        }
-        
-        try:
-            if not self.webhook_url:
-                logger.error("No webhook URL configured")
-                return False
-                
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                logger.info("Daily digest sent to Slack successfully")
-                return True
-            else:
-                logger.error(f"Failed to send digest to Slack: {response.status_code} - {response.text}")
-                return False
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error sending digest to Slack: {e}")
-            return False
\ No newline at end of file
+        self._built, self._built_key = blocks, key
+        return blocks
@@ -1,13 +1,25 @@
-import requests
 import logging
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from .config import Config
 from .security import sanitize_text_for_slack
+from .slack_client import _context, _section, create_webhook_session, encode_payload
+
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
+# Static blocks reused by every digest. They are shared, so never mutate them.
+_DIVIDER: Dict[str, Any] = {"type": "divider"}
+_TIP_HEADING: Dict[str, Any] = _section("💡 *AI TIP OF THE DAY* 💡")
+_TOOL_HEADING: Dict[str, Any] = _section("🔧 *TOOL SPOTLIGHT* 🔧")
+_PODCASTS_HEADING: Dict[str, Any] = _section("🎙️ *TODAY'S AI PODCASTS*")
+_NEWS_HEADING: Dict[str, Any] = _section("📰 *TODAY'S AI NEWS*")
+_FOOTER: Dict[str, Any] = _context("🤖 _AI Daily Digest • Delivered weekdays at 8 AM MST_")
+
 
 class SlackDigest:
     """Collect all daily content and send as a single digest message"""
@@ -20,6 +32,26 @@ class SlackDigest:
         self.ai_tip: Optional[str] = None
         self.tool_spotlight: Optional[Dict[str, str]] = None
         self.stats: Dict[str, int] = {'news_count': 0, 'podcast_count': 0, 'errors': 0}
+        # Last built blocks, reused when a send is retried without new content
+        self._built: Optional[List[Dict[str, Any]]] = None
+        self._built_key: Optional[Tuple[Any, ...]] = None
+    
+    @cached_property
+    def _session(self) -> "requests.Session":
+        """Keep-alive session reused across sends (e.g. retries)"""
+        return create_webhook_session()
+    
+    def close(self) -> None:
+        """Release pooled webhook connections"""
+        session = self.__dict__.pop('_session', None)
+        if session is not None:
+            session.close()
+    
+    def __enter__(self) -> "SlackDigest":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
     
     def add_news_item(self, article: Dict[str, Any], summary: List[str]) -> None:
         """Add a news item to the digest"""
@@ -55,7 +87,17 @@ class SlackDigest:
     
     def build_digest(self) -> List[Dict[str, Any]]:
         """Build the complete digest message blocks with new ordering"""
-        blocks = []
+        key = (
+            len(self.news_items),
+            len(self.podcast_items),
+            self.ai_tip,
+            self.tool_spotlight and tuple(self.tool_spotlight.values()),
+            self.stats['errors']
+        )
+        if key == self._built_key and self._built is not None:
+            return self._built
+
+        blocks: List[Dict[str, Any]] = []
         
         # Header - more casual and exciting
         blocks.extend([
@@ -67,137 +109,68 @@ class SlackDigest:
                     "emoji": True
                 }
             },
-            {"type": "divider"}
+            _DIVIDER
         ])
         
         # AI Tip of the Day (prominent at the top)
         if self.ai_tip:
             blocks.extend([
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "💡 *AI TIP OF THE DAY* 💡"
-                    }
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": sanitize_text_for_slack(self.ai_tip)
-                    }
-                },
-                {"type": "divider"}
+                _TIP_HEADING,
+                _section(sanitize_text_for_slack(self.ai_tip)),
+                _DIVIDER
             ])
         
         # Tool Spotlight (if available)
         if self.tool_spotlight:
             blocks.extend([
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "🔧 *TOOL SPOTLIGHT* 🔧"
-                    }
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*<{self.tool_spotlight['link']}|{sanitize_text_for_slack(self.tool_spotlight['name'])}>*\n{sanitize_text_for_slack(self.tool_spotlight['description'])}"
-                    }
-                },
-                {"type": "divider"}
+                _TOOL_HEADING,
+                _section(f"*<{self.tool_spotlight['link']}|{sanitize_text_for_slack(self.tool_spotlight['name'])}>*\n{sanitize_text_for_slack(self.tool_spotlight['description'])}"),
+                _DIVIDER
             ])
         
         # Podcasts First (more prominent)
         if self.podcast_items:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "🎙️ *TODAY'S AI PODCASTS*"
-                }
-            })
+            blocks.append(_PODCASTS_HEADING)
             
             # Limit to 3 most recent podcasts
-            for item in self.podcast_items[:Config.MAX_PODCAST_ITEMS]:
-                episode = item['episode']
-                summary = item['summary']
-                
-                safe_title = sanitize_text_for_slack(episode.get('title', 'No Title'))
-                safe_summary = [sanitize_text_for_slack(point) for point in summary[:2]]  # Limit to 2 bullet points
-                safe_feed = sanitize_text_for_slack(episode.get('feed_name', 'Unknown'))
-                
-                blocks.extend([
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"*<{episode.get('url', '#')}|{safe_title}>*\n_{safe_feed}_"
-                        }
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": "\n".join([f"• {point}" for point in safe_summary])
-                        }
-                    }
-                ])
+            blocks += [
+                block
+                for item in self.podcast_items[:Config.MAX_PODCAST_ITEMS]
+                for block in self._item_blocks(item['episode'], item['summary'][:2])  # Limit to 2 bullet points
+            ]
             
-            blocks.append({"type": "divider"})
+            blocks.append(_DIVIDER)
         
         # News Articles Second
         if self.news_items:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "📰 *TODAY'S AI NEWS*"
-                }
-            })
+            blocks.append(_NEWS_HEADING)
             
             # Limit to 3 most relevant news items
-            for item in self.news_items[:Config.MAX_NEWS_ITEMS]:
-                article = item['article']
-                summary = item['summary']
-                
-                safe_title = sanitize_text_for_slack(article.get('title', 'No Title'))
-                safe_summary = [sanitize_text_for_slack(point) for point in summary[:2]]  # Limit to 2 bullet points
-                safe_feed = sanitize_text_for_slack(article.get('feed_name', 'Unknown'))
-                
-                blocks.extend([
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"*<{article.get('url', '#')}|{safe_title}>*\n_{safe_feed}_"
-                        }
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": "\n".join([f"• {point}" for point in safe_summary])
-                        }
-                    }
-                ])
+            blocks += [
+                block
+                for item in self.news_items[:Config.MAX_NEWS_ITEMS]
+                for block in self._item_blocks(item['article'], item['summary'][:2])  # Limit to 2 bullet points
+            ]
             
-            blocks.append({"type": "divider"})
+            blocks.append(_DIVIDER)
         
         # Simplified footer
-        blocks.append({
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": "🤖 _AI Daily Digest • Delivered weekdays at 8 AM MST_"
-                }
-            ]
-        })
+        blocks.append(_FOOTER)
         
-        return blocks  # type: ignore[return-value]
+        self._built, self._built_key = blocks, key
+        return blocks
+    
+    @staticmethod
+    def _item_blocks(entry: Dict[str, Any], summary: List[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Build the title and bullet-list sections for one article or episode"""
+        safe_title = sanitize_text_for_slack(entry.get('title', 'No Title'))
+        safe_summary = [sanitize_text_for_slack(point) for point in summary]
+        safe_feed = sanitize_text_for_slack(entry.get('feed_name', 'Unknown'))
+        
+        return (
+            _section(f"*<{entry.get('url', '#')}|{safe_title}>*\n_{safe_feed}_"),
+            _section("• " + "\n• ".join(safe_summary) if safe_summary else "")
+        )
     
     def send_digest(self) -> bool:
         """Send the complete digest to Slack"""
@@ -217,15 +190,16 @@ class SlackDigest:
             "text": f"AI Daily Digest - {self.stats['news_count']} articles, {self.stats['podcast_count']} podcasts"  # Fallback text
         }
         
+        from requests import RequestException
+
         try:
             if not self.webhook_url:
                 logger.error("No webhook URL configured")
                 return False
                 
-            response = requests.post(
+            response = self._session.post(
                 self.webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
+                data=encode_payload(payload),
                 timeout=10
             )
             
@@ -236,6 +210,6 @@ class SlackDigest:
                 logger.error(f"Failed to send digest to Slack: {response.status_code} - {response.text}")
                 return False
                 
-        except requests.exceptions.RequestException as e:
+        except RequestException as e:
             logger.error(f"Error sending digest to Slack: {e}")
             return False
\ No newline at end of file
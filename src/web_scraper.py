@@ -1,9 +1,17 @@
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from bs4 import BeautifulSoup
+import soupsieve
+import lxml.html
+from lxml import etree
 import logging
-from typing import Optional, Dict, Union
+import sqlite3
+from typing import Any, Optional, Dict, List, Tuple, Union
 from bs4.element import Tag, PageElement
 import time
+from functools import cached_property
 from urllib.parse import urlparse
 
 from .config import Config
@@ -12,15 +20,85 @@ from .rate_limiter import rate_limit
 
 logger = logging.getLogger(__name__)
 
+# aiohttp and aiolimiter are optional; without them fetch_many fetches sequentially
+try:
+    import aiohttp
+    from aiolimiter import AsyncLimiter
+    HAVE_AIOHTTP = True
+except ImportError:
+    aiohttp = None  # type: ignore[assignment]
+    AsyncLimiter = None  # type: ignore[assignment,misc]
+    HAVE_AIOHTTP = False
+
+# selectolax is optional; its lexbor engine runs the common extraction path
+# far faster than BeautifulSoup, which stays as the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAVE_SELECTOLAX = True
+except ImportError:
+    LexborHTMLParser = None  # type: ignore[assignment,misc]
+    HAVE_SELECTOLAX = False
+
+
+USER_AGENT = 'AI-News-Summarizer/1.0 (Mozilla/5.0 compatible; AI Bot)'
+
+# Headers for both the requests and aiohttp sessions. Asking for HTML only
+# keeps content negotiation from picking other representations.
+REQUEST_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml',
+}
+
+# Concurrency limits for fetch_many
+FETCH_CONCURRENCY = 16
+FETCH_LIMIT_PER_HOST = 4
+
+# Metadata keys read by extract_metadata: (key, meta attribute, attribute value)
+_META_KEYS = (
+    ('description', 'name', 'description'),
+    ('og_title', 'property', 'og:title'),
+    ('og_description', 'property', 'og:description'),
+)
+
+# Title and every wanted <meta> tag in one document-order walk
+_METADATA_XPATH = etree.XPath(
+    '//title | //meta[' + ' or '.join(f'@{attr}="{value}"' for _, attr, value in _META_KEYS) + ']'
+)
+
+# We always hand lxml UTF-8 bytes, so ignore any charset the page declares
+_UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# One pooled session per process so repeat hosts reuse their TCP+TLS
+# connections across scraper instances; retries are handled by the caller loop
+_SESSION = requests.Session()
+_SESSION.headers.update(REQUEST_HEADERS)
+# urllib3 lists 'br' only when brotli is importable, so we never advertise an
+# encoding we cannot decode (aiohttp applies the same rule on its own)
+_SESSION.headers['Accept-Encoding'] = ACCEPT_ENCODING
+for _prefix in ('http://', 'https://'):
+    _SESSION.mount(_prefix, HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+
 
 class WebScraper:
     """Extract article content from web pages"""
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'AI-News-Summarizer/1.0 (Mozilla/5.0 compatible; AI Bot)'
-        })
+    # Content containers for sites whose markup defeats the generic selectors,
+    # keyed by registered domain: (tag, attrs) for soup.find
+    _SITE_RULES: Dict[str, Tuple[str, Dict[str, str]]] = {
+        'theverge.com': ('div', {'class': 'c-entry-content'}),
+        'techcrunch.com': ('div', {'class': 'article-content'}),
+        'nytimes.com': ('section', {'name': 'articleBody'}),
+        'wired.com': ('div', {'class': 'body__inner-container'}),
+        'sciencedaily.com': ('div', {'id': 'text'}),
+    }
+
+    def __init__(self, cache_path: Optional[str] = None) -> None:
+        self.session = _SESSION
+
+        # Extracted text plus ETag/Last-Modified per article, so unchanged
+        # pages come back as 304s; /tmp survives warm invocations. The
+        # connection is opened on first fetch and released by close().
+        self.cache_path = cache_path or Config.ARTICLE_CACHE_PATH
 
         # Common selectors for article content
         self.content_selectors = [
@@ -40,9 +118,91 @@ class WebScraper:
         self.remove_tags = ['script', 'style', 'nav', 'header', 'footer', 'aside',
                            'form', 'button', 'iframe', 'noscript']
 
+        # Content selectors compiled once rather than parsed per article
+        self._content_matchers = [soupsieve.compile(selector) for selector in self.content_selectors]
+
+        # All removable tags as one selector, compiled once for a single tree walk
+        self._remove_selector = ','.join(self.remove_tags)
+        self._remove_matcher = soupsieve.compile(self._remove_selector)
+
+    @cached_property
+    def _cache(self) -> Optional[sqlite3.Connection]:
+        """Open the article cache, dropping entries older than ARTICLE_CACHE_DAYS"""
+        try:
+            conn = sqlite3.connect(self.cache_path)
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS articles ('
+                'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content TEXT, fetched_at REAL)'
+            )
+            conn.execute(
+                'DELETE FROM articles WHERE fetched_at < ?',
+                (time.time() - Config.ARTICLE_CACHE_DAYS * 86400,)
+            )
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            logger.warning(f"Article cache unavailable at {self.cache_path}: {e}")
+            return None
+
+    def close(self) -> None:
+        """Close the article cache connection if one was opened"""
+        conn = self.__dict__.pop('_cache', None)
+        if conn is not None:
+            conn.close()
+
+    def __enter__(self) -> "WebScraper":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _cached_article(self, url: str) -> Optional[Tuple[str, str, str]]:
+        """Return (etag, last_modified, content) cached for a URL"""
+        if self._cache is None:
+            return None
+        try:
+            row: Optional[Tuple[str, str, str]] = self._cache.execute(
+                'SELECT etag, last_modified, content FROM articles WHERE url = ?', (url,)
+            ).fetchone()
+            return row
+        except sqlite3.Error as e:
+            logger.warning(f"Article cache read failed: {e}")
+            return None
+
+    @staticmethod
+    def _conditional_headers(cached: Optional[Tuple[str, str, str]]) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from a cache entry"""
+        headers: Dict[str, str] = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _store_article(self, url: str, etag: Optional[str], last_modified: Optional[str], content: str) -> None:
+        """Cache extracted content when the server gave us validators to revalidate it"""
+        if self._cache is None or not (etag or last_modified):
+            return
+        try:
+            self._cache.execute(
+                'INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?)',
+                (url, etag or '', last_modified or '', content, time.time())
+            )
+            self._cache.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Article cache write failed: {e}")
+
     @rate_limit('web_scraper', calls_per_minute=30)
-    def fetch_article_content(self, url: str) -> Optional[str]:
-        """Fetch and extract main article content from URL"""
+    def fetch_article_content(self, url: str, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Fetch and extract main article content from URL
+
+        Args:
+            url: Article URL
+            timeout: Per-request timeout in seconds (defaults to Config.REQUEST_TIMEOUT)
+        """
         # Validate URL for security
         clean_url = validate_url(url)
         if not clean_url:
@@ -52,11 +212,16 @@ class WebScraper:
         for attempt in range(Config.MAX_RETRIES):
             try:
                 logger.info(f"Fetching article content from: {clean_url}")
+                cached = self._cached_article(clean_url)
                 response = self.session.get(
                     clean_url,
-                    timeout=Config.REQUEST_TIMEOUT,
+                    headers=self._conditional_headers(cached),
+                    timeout=timeout if timeout is not None else Config.REQUEST_TIMEOUT,
                     stream=True  # Stream to check content length
                 )
+                if response.status_code == 304 and cached:
+                    logger.info(f"Article not modified, using cached content: {clean_url}")
+                    return cached[2]
                 response.raise_for_status()
 
                 # Check content length
@@ -65,19 +230,25 @@ class WebScraper:
                     logger.warning(f"Content too large: {content_length} bytes")
                     return None
 
-                # Read content with size limit
-                content = ""
-                size = 0
-                for chunk in response.iter_content(chunk_size=8192, decode_unicode=True):
-                    if chunk:
-                        size += len(chunk)
-                        if size > MAX_CONTENT_LENGTH:
-                            logger.warning("Content exceeds maximum allowed size")
-                            return None
-                        content += chunk
+                # Read raw bytes with size limit; bytearray grows in place
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=8192):
+                    body += chunk
+                    if len(body) > MAX_CONTENT_LENGTH:
+                        logger.warning("Content exceeds maximum allowed size")
+                        return None
+
+                # Decode once instead of per chunk
+                content = body.decode(response.encoding or 'utf-8', errors='replace')
 
                 extracted = self._extract_content(content, clean_url)
                 if extracted:
+                    self._store_article(
+                        clean_url,
+                        response.headers.get('ETag'),
+                        response.headers.get('Last-Modified'),
+                        extracted
+                    )
                     return extracted
                 else:
                     logger.warning(f"No content extracted from {clean_url}")
@@ -94,21 +265,118 @@ class WebScraper:
                 return None
         return None
 
+    async def fetch_many(self, urls: List[str], timeout: Optional[float] = None) -> Dict[str, Optional[str]]:
+        """
+        Fetch and extract many articles concurrently
+
+        Downloads share one aiohttp session bounded by FETCH_CONCURRENCY and
+        the 30 requests/minute scraper limit, and HTML extraction runs in the default executor so parsing never blocks
+        the event loop. Unlike fetch_article_content there are no retries.
+
+        Args:
+            urls: Article URLs
+            timeout: Per-request timeout in seconds (defaults to Config.REQUEST_TIMEOUT)
+
+        Returns:
+            Mapping of each URL to its extracted content, or None on failure
+        """
+        if not HAVE_AIOHTTP:
+            return {url: self.fetch_article_content(url, timeout=timeout) for url in urls}
+
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        # Same 30 requests/minute budget as the sync path, but waiting for a
+        # token yields to the event loop instead of blocking it with time.sleep.
+        # Built per call, like the semaphore, since each asyncio.run is a new loop
+        limiter = AsyncLimiter(30, 60)
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=FETCH_LIMIT_PER_HOST)
+        client_timeout = aiohttp.ClientTimeout(
+            total=timeout if timeout is not None else Config.REQUEST_TIMEOUT
+        )
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=client_timeout,
+            headers=REQUEST_HEADERS
+        ) as session:
+            results = await asyncio.gather(
+                *(self._fetch_one(session, semaphore, limiter, url) for url in urls)
+            )
+
+        return dict(zip(urls, results))
+
+    async def _fetch_one(self, session: "aiohttp.ClientSession", semaphore: asyncio.Semaphore,
+                         limiter: "AsyncLimiter", url: str) -> Optional[str]:
+        """Download one article for fetch_many and extract its content"""
+        clean_url = validate_url(url)
+        if not clean_url:
+            logger.warning(f"Invalid or blocked URL: {url}")
+            return None
+
+        cached = self._cached_article(clean_url)
+
+        async with semaphore, limiter:
+            try:
+                logger.info(f"Fetching article content from: {clean_url}")
+                async with session.get(clean_url, headers=self._conditional_headers(cached)) as response:
+                    if response.status == 304 and cached:
+                        logger.info(f"Article not modified, using cached content: {clean_url}")
+                        return cached[2]
+                    response.raise_for_status()
+
+                    if response.content_length and response.content_length > MAX_CONTENT_LENGTH:
+                        logger.warning(f"Content too large: {response.content_length} bytes")
+                        return None
+
+                    body = bytearray()
+                    async for chunk in response.content.iter_chunked(8192):
+                        body += chunk
+                        if len(body) > MAX_CONTENT_LENGTH:
+                            logger.warning("Content exceeds maximum allowed size")
+                            return None
+
+                    html = body.decode(response.charset or 'utf-8', errors='replace')
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+            except Exception as e:  # e.g. LookupError for an unknown declared charset
+                logger.error(f"Unexpected error scraping {url}: {e}")
+                return None
+
+        # One page failing to parse must not fail the whole gather
+        try:
+            loop = asyncio.get_running_loop()
+            extracted = await loop.run_in_executor(None, self._extract_content, html, clean_url)
+            if extracted:
+                self._store_article(clean_url, etag, last_modified, extracted)
+            else:
+                logger.warning(f"No content extracted from {clean_url}")
+            return extracted
+        except Exception as e:
+            logger.error(f"Unexpected error scraping {url}: {e}")
+            return None
+
     def _extract_content(self, html: str, url: str) -> Optional[str]:
         """Extract main content from HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
+        if HAVE_SELECTOLAX:
+            text = self._extract_content_fast(html)
+            if text:
+                return text
+
+        soup = BeautifulSoup(html, 'lxml')
 
         # Remove unwanted elements
-        for tag in self.remove_tags:
-            for element in soup.find_all(tag):
-                element.decompose()
+        for element in self._remove_matcher.select(soup):
+            element.decompose()
 
         # Try to find article content using various selectors
         article_content: Optional[Union[Tag, PageElement]] = None
 
         # First try specific selectors
-        for selector in self.content_selectors:
-            content_elem = soup.select_one(selector)
+        for matcher in self._content_matchers:
+            content_elem = matcher.select_one(soup)
             if content_elem:
                 article_content = content_elem
                 break
@@ -117,13 +385,12 @@ class WebScraper:
         if not article_content:
             article_content = self._site_specific_extraction(soup, url)
 
-        # If still no content, fall back to finding largest text block
-        if not article_content:
-            article_content = self._find_largest_text_block(soup)
+        # If still no content, fall back to the text of the largest text block
+        raw_text = article_content.get_text() if article_content else self._find_largest_text_block(soup)
 
-        if article_content:
-            # Extract text and clean it
-            text = self._clean_text(article_content.get_text())
+        if raw_text:
+            # Clean the extracted text
+            text = self._clean_text(raw_text)
 
             # Ensure we have substantial content
             if len(text) > 200:  # Minimum content length
@@ -131,47 +398,56 @@ class WebScraper:
 
         return None
 
-    def _site_specific_extraction(self, soup: BeautifulSoup, url: str) -> Optional[Union[Tag, PageElement]]:
-        """Handle site-specific content extraction"""
-        domain = urlparse(url).netloc.lower()
+    def _extract_content_fast(self, html: str) -> Optional[str]:
+        """Extract content with selectolax using the generic selectors only
 
-        # The Verge
-        if 'theverge.com' in domain:
-            return soup.find('div', class_='c-entry-content')
+        Returns None when no selector matches or the match is too short, so
+        the caller can fall back to the site-specific and paragraph heuristics.
+        """
+        tree = LexborHTMLParser(html)
 
-        # TechCrunch
-        elif 'techcrunch.com' in domain:
-            return soup.find('div', class_='article-content')
+        for node in tree.css(self._remove_selector):
+            node.decompose()
 
-        # NY Times
-        elif 'nytimes.com' in domain:
-            return soup.find('section', {'name': 'articleBody'})
+        for selector in self.content_selectors:
+            body_node = tree.css_first(selector)
+            if body_node is not None:
+                # Same text as BeautifulSoup's get_text(): no separators added
+                text = self._clean_text(body_node.text(separator=''))
+                return text if len(text) > 200 else None
 
-        # Wired
-        elif 'wired.com' in domain:
-            return soup.find('div', class_='body__inner-container')
+        return None
 
-        # Science Daily
-        elif 'sciencedaily.com' in domain:
-            return soup.find('div', id='text')
+    def _site_specific_extraction(self, soup: BeautifulSoup, url: str) -> Optional[Union[Tag, PageElement]]:
+        """Handle site-specific content extraction"""
+        hostname = urlparse(url).hostname or ''
 
-        return None
+        # Exact registered-domain hit first, substring scan only for odd hosts
+        rule = self._SITE_RULES.get('.'.join(hostname.rsplit('.', 2)[-2:]))
+        if rule is None:
+            rule = next((r for domain, r in self._SITE_RULES.items() if domain in hostname), None)
+        if rule is None:
+            return None
+
+        tag, attrs = rule
+        return soup.find(tag, attrs)
 
-    def _find_largest_text_block(self, soup: BeautifulSoup) -> Optional[Tag]:
-        """Find the largest contiguous text block as fallback"""
+    def _find_largest_text_block(self, soup: BeautifulSoup) -> Optional[str]:
+        """Return the text of the largest run of consecutive paragraphs as fallback"""
         # Find all paragraphs
         paragraphs = soup.find_all('p')
 
         if not paragraphs:
             return None
 
-        # Group consecutive paragraphs
+        # Group consecutive paragraphs, walking each paragraph's text only once
         groups = []
         current_group = []
 
         for p in paragraphs:
-            if p.get_text(strip=True):
-                current_group.append(p)
+            text = p.get_text()
+            if text.strip():
+                current_group.append(text)
             else:
                 if current_group:
                     groups.append(current_group)
@@ -180,28 +456,17 @@ class WebScraper:
         if current_group:
             groups.append(current_group)
 
-        # Find largest group
+        # Join the largest group; no need to move the nodes into a new container
         if groups:
-            largest_group = max(groups, key=lambda g: sum(len(p.get_text()) for p in g))
-
-            # Create a container with the largest group
-            container = soup.new_tag('div')
-            for p in largest_group:
-                container.append(p)
-
-            return container
+            return ''.join(max(groups, key=lambda g: sum(len(text) for text in g)))
 
         return None
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text"""
-        # Remove excessive whitespace
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        text = '\n'.join(lines)
-
-        # Remove multiple consecutive newlines
-        while '\n\n\n' in text:
-            text = text.replace('\n\n\n', '\n\n')
+        # Strip every line and drop blank ones, so no blank-line runs remain
+        stripped = (line.strip() for line in text.splitlines())
+        text = '\n'.join(line for line in stripped if line)
 
         # Limit total length to avoid token limits
         max_chars = 5000
@@ -212,29 +477,38 @@ class WebScraper:
 
     def extract_metadata(self, html: str) -> Dict[str, str]:
         """Extract metadata from HTML (title, description, etc.)"""
-        soup = BeautifulSoup(html, 'html.parser')
+        if HAVE_SELECTOLAX:
+            return self._extract_metadata_fast(html)
+
+        metadata: Dict[str, str] = {}
+        try:
+            root = lxml.html.fromstring(html.encode('utf-8'), parser=_UTF8_HTML_PARSER)
+        except etree.ParserError:  # Empty document
+            return metadata
+
+        # First match per key wins, as with separate soup.find calls
+        for element in _METADATA_XPATH(root):
+            if element.tag == 'title':
+                metadata.setdefault('title', element.text_content().strip())
+                continue
+            for key, attr, value in _META_KEYS:
+                if element.get(attr) == value:
+                    metadata.setdefault(key, element.get('content') or '')
+
+        return metadata
+
+    def _extract_metadata_fast(self, html: str) -> Dict[str, str]:
+        """selectolax version of extract_metadata"""
+        tree = LexborHTMLParser(html)
         metadata = {}
 
-        # Title
-        title_tag = soup.find('title')
-        if title_tag:
-            metadata['title'] = title_tag.get_text(strip=True)
-
-        # Meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and hasattr(meta_desc, 'get'):
-            content = meta_desc.get('content', '')
-            metadata['description'] = str(content) if content else ''
-
-        # Open Graph data
-        og_title = soup.find('meta', attrs={'property': 'og:title'})
-        if og_title and hasattr(og_title, 'get'):
-            content = og_title.get('content', '')
-            metadata['og_title'] = str(content) if content else ''
-
-        og_desc = soup.find('meta', attrs={'property': 'og:description'})
-        if og_desc and hasattr(og_desc, 'get'):
-            content = og_desc.get('content', '')
-            metadata['og_description'] = str(content) if content else ''
+        title_node = tree.css_first('title')
+        if title_node is not None:
+            metadata['title'] = title_node.text(strip=True)
+
+        for key, attr, value in _META_KEYS:
+            node = tree.css_first(f'meta[{attr}="{value}"]')
+            if node is not None:
+                metadata[key] = node.attributes.get('content') or ''
 
         return metadata
@@ -0,0 +1,124 @@
+import os
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import feedparser
+import pytest
+
+# Make the src package importable once for the whole test session
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Config reads the environment at import, so this must precede the src imports;
+# ENVIRONMENT=test keeps src.main from creating a real Error Reporting client
+os.environ['ENVIRONMENT'] = 'test'
+
+from src.ai_content_filter import AIContentFilter  # noqa: E402
+from src.config import Config  # noqa: E402
+from src.llm_client import LLMClient  # noqa: E402
+from src.rss_parser import RSSParser  # noqa: E402
+from src.slack_client import SlackClient  # noqa: E402
+from src.slack_digest_v2 import SlackDigest  # noqa: E402
+
+TEST_WEBHOOK_URL = "https://hooks.slack.com/services/T000/B000/XXXX"
+
+# Recorded feeds: rss_small.xml plus one feeds/<slug>.xml per configured feed
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture(scope="session")
+def ai_filter():
+    """One content filter, with its keyword sets and patterns built once"""
+    return AIContentFilter()
+
+
+@pytest.fixture(scope="session")
+def rss_fixtures():
+    """Raw bytes of every feed fixture, keyed by file stem; read once per worker"""
+    return {path.stem: path.read_bytes() for path in sorted(FIXTURES_DIR.rglob('*.xml'))}
+
+
+@pytest.fixture(scope="session")
+def parsed_fixtures(rss_fixtures):
+    """Every feed fixture parsed once, keyed like rss_fixtures"""
+    return {name: feedparser.parse(body) for name, body in rss_fixtures.items()}
+
+
+@pytest.fixture(scope="session")
+def llm():
+    """One LLM client, and its connection pool, shared by every test"""
+    with patch.object(Config, 'OPENROUTER_API_KEY', Config.OPENROUTER_API_KEY or 'test-key'):
+        client = LLMClient()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def rss(tmp_path_factory):
+    """One RSS parser, caching validators outside /tmp and retrying without backoff"""
+    return RSSParser(cache_path=str(tmp_path_factory.mktemp('rss') / 'feed_cache.json'), backoff_factor=0)
+
+
+@pytest.fixture(scope="session")
+def webhook_session():
+    """The Mock every stubbed Slack post goes through; reset per test by stub_webhook"""
+    return Mock()
+
+
+@pytest.fixture(scope="session")
+def slack(webhook_session):
+    """One SlackClient, bound to the stub webhook session for the whole run"""
+    with patch.object(Config, 'SLACK_WEBHOOK_URL', TEST_WEBHOOK_URL):
+        client = SlackClient()
+    client._session = webhook_session
+    return client
+
+
+@pytest.fixture
+def stub_webhook(webhook_session):
+    """Point digests and SlackClient at a stub webhook session instead of Slack"""
+    webhook_session.reset_mock()
+    webhook_session.post.return_value = Mock(status_code=200)
+    with patch.object(Config, 'SLACK_WEBHOOK_URL', TEST_WEBHOOK_URL), \
+            patch('src.slack_client.create_webhook_session', return_value=webhook_session), \
+            patch('src.slack_digest_v2.create_webhook_session', return_value=webhook_session):
+        yield webhook_session
+
+
+@pytest.fixture
+def digest(stub_webhook):
+    """A fresh digest per test, since adding items mutates it"""
+    digest = SlackDigest()
+    yield digest
+    digest.close()
+
+
+@pytest.fixture
+def main_mocks():
+    """Patch every external client src.main constructs; one mock per client"""
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            rss=stack.enter_context(patch('src.main.RSSParser')),
+            scraper=stack.enter_context(patch('src.main.WebScraper')),
+            llm=stack.enter_context(patch('src.main.LLMClient')),
+            db=stack.enter_context(patch('src.main.FirestoreClient')),
+            slack=stack.enter_context(patch('src.main.SlackClient')),
+        )
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--external-api", action="store_true", default=False,
+        help="run tests marked external_api against live third-party endpoints"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--external-api"):
+        return
+    skip_external = pytest.mark.skip(reason="needs --external-api")
+    for item in items:
+        if "external_api" in item.keywords:
+            item.add_marker(skip_external)
@@ -1,13 +1,18 @@
 import unittest
 import os
 from unittest.mock import patch
+import pytest
 
 from src.config import Config
 
 
+@pytest.mark.unit
 class TestConfig(unittest.TestCase):
     """Test configuration module"""
 
+    def setUp(self):
+        Config.get_all_feeds.cache_clear()
+
     def test_config_defaults(self):
         """Test default configuration values"""
         self.assertEqual(Config.OPENROUTER_BASE_URL, "https://openrouter.ai/api/v1")
@@ -56,6 +61,11 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(len(all_feeds), 8)  # 5 news + 3 podcasts
         self.assertTrue(all(isinstance(feed, dict) for feed in all_feeds))
 
+    def test_get_all_feeds_cached(self):
+        """Test the combined feed list is built once and reused"""
+        self.assertIs(Config.get_all_feeds(), Config.get_all_feeds())
+        self.assertEqual(Config.get_all_feeds(), tuple(Config.NEWS_FEEDS + Config.PODCAST_FEEDS))
+
 
 if __name__ == '__main__':
     unittest.main()
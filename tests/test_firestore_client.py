@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Test the local processed-URL cache in front of Firestore"""
+
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.config import Config
+from src.firestore_client import FirestoreClient
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / 'processed_urls.json'
+    monkeypatch.setattr(Config, 'PROCESSED_CACHE_PATH', str(path))
+    return path
+
+
+@pytest.fixture
+def make_client(cache_path):
+    """Build FirestoreClients against a mocked Firestore"""
+    with patch('src.firestore_client.firestore.Client'):
+        yield FirestoreClient
+
+
+def _existing_doc(exists=True, doc_id=''):
+    return Mock(exists=exists, id=doc_id)
+
+
+def test_load_drops_expired_and_invalid_entries(cache_path, make_client):
+    """Test entries past PROCESSED_CACHE_DAYS or with bad timestamps are ignored"""
+    now = time.time()
+    cache_path.write_text(json.dumps({
+        'https://example.com/fresh': now,
+        'https://example.com/stale': now - (Config.PROCESSED_CACHE_DAYS + 1) * 86400,
+        'https://example.com/bad': 'yesterday',
+    }))
+
+    client = make_client()
+
+    assert list(client._processed) == ['https://example.com/fresh']
+
+
+@pytest.mark.parametrize('contents', ['not json', '["a list"]'])
+def test_load_ignores_unreadable_cache(cache_path, make_client, contents):
+    """Test a corrupt cache file starts an empty cache"""
+    cache_path.write_text(contents)
+
+    assert make_client()._processed == {}
+
+
+def test_cached_url_skips_firestore(cache_path, make_client):
+    """Test a cached URL is answered without a Firestore read"""
+    cache_path.write_text(json.dumps({'https://example.com/a': time.time()}))
+    client = make_client()
+
+    assert client.is_url_processed('https://example.com/a') is True
+    client.collection.document.assert_not_called()
+
+
+def test_firestore_hits_written_once_on_flush(cache_path, make_client):
+    """Test Firestore hits and new marks are cached and written only by flush"""
+    client = make_client()
+    client.collection.document.return_value.get.return_value = _existing_doc()
+
+    assert client.is_url_processed('https://example.com/a') is True
+    assert client.mark_url_processed('https://example.com/b') is True
+    assert not cache_path.exists()
+
+    client.flush()
+
+    assert set(json.loads(cache_path.read_text())) == {'https://example.com/a', 'https://example.com/b'}
+    assert set(make_client()._processed) == {'https://example.com/a', 'https://example.com/b'}
+
+
+def test_flush_without_changes_does_not_write(cache_path, make_client):
+    """Test flush leaves the file alone when nothing new was recorded"""
+    client = make_client()
+    client.collection.document.return_value.get.return_value = _existing_doc(exists=False)
+
+    assert client.is_url_processed('https://example.com/a') is False
+    client.flush()
+
+    assert not cache_path.exists()
+
+
+def test_batch_check_warms_cache(cache_path, make_client):
+    """Test batch_check_urls records the Firestore hits it finds"""
+    client = make_client()
+    hit, miss = 'https://example.com/hit', 'https://example.com/miss'
+    client.collection.document.side_effect = lambda doc_id: Mock(id=doc_id)
+    client.db.get_all.return_value = [
+        _existing_doc(doc_id=client._get_document_id(hit)),
+        _existing_doc(exists=False, doc_id=client._get_document_id(miss)),
+    ]
+
+    assert client.batch_check_urls([hit, miss]) == {hit: True, miss: False}
+    client.flush()
+
+    assert list(json.loads(cache_path.read_text())) == [hit]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
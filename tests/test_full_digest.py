@@ -5,26 +5,30 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.slack_digest_v2 import SlackDigest
+import pytest
 from src.llm_client import LLMClient
+from unittest.mock import patch
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
-def test_full_digest():
+pytestmark = pytest.mark.unit
+
+
+@patch.object(LLMClient, 'generate_tool_spotlight', return_value={
+    'name': 'Stub Tool', 'description': 'A stubbed tool spotlight', 'link': 'https://example.com/tool'
+})
+@patch.object(LLMClient, 'generate_ai_tip', return_value="stub tip")
+def test_full_digest(mock_tip, mock_tool, digest, llm, stub_webhook):
     """Test the complete digest with all features"""
     
-    # Initialize clients
-    digest = SlackDigest()
-    llm_client = LLMClient()
-    
     print("🚀 Testing Full AI Daily Digest with Tool Spotlight")
     print("=" * 50)
     
     # 1. Generate AI tip
     print("\n1️⃣ Generating AI Tip...")
     try:
-        ai_tip = llm_client.generate_ai_tip()
+        ai_tip = llm.generate_ai_tip()
         if ai_tip:
             digest.set_ai_tip(ai_tip)
             print(f"✅ AI Tip: {ai_tip}")
@@ -35,7 +39,7 @@ def test_full_digest():
     # 2. Generate tool spotlight
     print("\n2️⃣ Generating Tool Spotlight...")
     try:
-        tool = llm_client.generate_tool_spotlight()
+        tool = llm.generate_tool_spotlight()
         if tool:
             digest.set_tool_spotlight(tool['name'], tool['description'], tool['link'])
             print(f"✅ Tool: {tool['name']}")
@@ -108,7 +112,8 @@ def test_full_digest():
     else:
         print("\n❌ Failed to send digest")
     
-    return success
+    assert success
+    stub_webhook.post.assert_called_once()
 
 if __name__ == "__main__":
-    test_full_digest()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
\ No newline at end of file
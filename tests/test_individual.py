@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test individual components without duplication"""
 
+import pytest
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -12,6 +13,9 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+pytestmark = pytest.mark.network
+
+
 def test_ai_tip_only():
     """Test just the AI tip generation"""
     print("🧪 Testing AI Tip Generation Only...")
@@ -1,10 +1,25 @@
 import unittest
+from contextlib import ExitStack
 from unittest.mock import Mock, patch
+import pytest
 import os
 
+from cloudevents.http import CloudEvent
+
+from src.config import Config
 from src.main import main_function
 
+# Clients main_function constructs; each is patched as src.main.<name>
+MAIN_CLIENTS = ['RSSParser', 'WebScraper', 'LLMClient', 'FirestoreClient', 'SlackClient']
+
+# Pub/Sub event handed to main_function; it is only read, so share it
+CLOUD_EVENT = CloudEvent(
+    {"type": "google.cloud.pubsub.topic.v1.messagePublished", "source": "test"},
+    {"message": {"data": "test"}}
+)
+
 
+@pytest.mark.unit
 class TestIntegration(unittest.TestCase):
     """Integration tests for the Cloud Function handler"""
 
@@ -15,16 +30,24 @@ class TestIntegration(unittest.TestCase):
         'FIRESTORE_COLLECTION': 'test_processed_items',
         'ENVIRONMENT': 'development'
     })
-    @patch('src.main.RSSParser')
-    @patch('src.main.WebScraper')
-    @patch('src.main.LLMClient')
-    @patch('src.main.FirestoreClient')
-    @patch('src.main.SlackClient')
-    def test_main_function_success(self, mock_slack, mock_db, mock_llm, mock_scraper, mock_rss):
+    def test_main_function_success(self):
         """Test successful Cloud Function execution"""
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        # Patch every client in one pass, keyed by name rather than decorator order
+        mocks = {name: stack.enter_context(patch(f'src.main.{name}')) for name in MAIN_CLIENTS}
+        # Config reads the environment at import time, so patch its attributes too
+        stack.enter_context(patch.multiple(
+            Config,
+            OPENROUTER_API_KEY='test-key',
+            SLACK_WEBHOOK_URL='https://hooks.slack.com/test',
+            GCP_PROJECT_ID='test-project',
+            FIRESTORE_COLLECTION='test_processed_items',
+            ENVIRONMENT='development'
+        ))
 
         # Mock RSS parser
-        mock_rss_instance = mock_rss.return_value
+        mock_rss_instance = mocks['RSSParser'].return_value
         mock_rss_instance.fetch_all_feeds.return_value = {
             'news': [
                 {
@@ -39,11 +62,11 @@ class TestIntegration(unittest.TestCase):
         }
 
         # Mock web scraper
-        mock_scraper_instance = mock_scraper.return_value
+        mock_scraper_instance = mocks['WebScraper'].return_value
         mock_scraper_instance.fetch_article_content.return_value = "Article content about AI"
 
         # Mock LLM client
-        mock_llm_instance = mock_llm.return_value
+        mock_llm_instance = mocks['LLMClient'].return_value
         mock_llm_instance.summarize_article.return_value = [
             "AI is transforming businesses",
             "New developments in machine learning",
@@ -52,31 +75,20 @@ class TestIntegration(unittest.TestCase):
         mock_llm_instance.generate_ai_tip.return_value = "Use AI to automate repetitive tasks"
 
         # Mock Firestore client
-        mock_db_instance = mock_db.return_value
+        mock_db_instance = mocks['FirestoreClient'].return_value
         mock_db_instance.is_url_processed.return_value = False
         mock_db_instance.mark_url_processed.return_value = True
         mock_db_instance.initialize_collection = Mock()
 
         # Mock Slack client
-        mock_slack_instance = mock_slack.return_value
+        mock_slack_instance = mocks['SlackClient'].return_value
         mock_slack_instance.send_daily_header.return_value = True
         mock_slack_instance.send_news_summary.return_value = True
         mock_slack_instance.send_ai_tip.return_value = True
         mock_slack_instance.send_daily_footer.return_value = True
 
-        # Execute Cloud Function
-        from cloudevents.http import CloudEvent
-
-        attributes = {
-            "type": "google.cloud.pubsub.topic.v1.messagePublished",
-            "source": "test",
-        }
-        data = {"message": {"data": "test"}}
-
-        cloud_event = CloudEvent(attributes, data)
-
-        # Cloud Functions don't return values for Pub/Sub triggers
-        main_function(cloud_event)
+        # Execute Cloud Function; they don't return values for Pub/Sub triggers
+        main_function(CLOUD_EVENT)
 
         # Verify calls
         mock_rss_instance.fetch_all_feeds.assert_called_once()
@@ -85,23 +97,38 @@ class TestIntegration(unittest.TestCase):
         mock_llm_instance.generate_ai_tip.assert_called_once()
         mock_db_instance.mark_url_processed.assert_called_once()
         mock_slack_instance.send_news_summary.assert_called_once()
+        mock_slack_instance.close.assert_called_once()
+        mock_scraper_instance.close.assert_called_once()
+
+    def test_main_function_error_releases_clients(self):
+        """Test clients are closed when the handler fails and re-raises"""
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        mocks = {name: stack.enter_context(patch(f'src.main.{name}')) for name in MAIN_CLIENTS}
+        stack.enter_context(patch.multiple(
+            Config,
+            OPENROUTER_API_KEY='test-key',
+            SLACK_WEBHOOK_URL='https://hooks.slack.com/test',
+            GCP_PROJECT_ID='test-project',
+            ENVIRONMENT='test'
+        ))
+        mocks['RSSParser'].return_value.fetch_all_feeds.side_effect = RuntimeError("feeds down")
+
+        with self.assertRaises(RuntimeError):
+            main_function(CLOUD_EVENT)
+
+        # The run's client is closed in the finally block, the notifier by its with block
+        mocks['SlackClient'].return_value.close.assert_called_once()
+        mocks['SlackClient'].return_value.__exit__.assert_called_once()
+        mocks['WebScraper'].return_value.close.assert_called_once()
 
     @patch.dict(os.environ, {})
+    @patch.multiple(Config, OPENROUTER_API_KEY=None, SLACK_WEBHOOK_URL=None, GCP_PROJECT_ID=None)
     def test_main_function_missing_config(self):
         """Test Cloud Function execution with missing configuration"""
-        from cloudevents.http import CloudEvent
-
-        attributes = {
-            "type": "google.cloud.pubsub.topic.v1.messagePublished",
-            "source": "test",
-        }
-        data = {"message": {"data": "test"}}
-
-        cloud_event = CloudEvent(attributes, data)
-
         # Should raise an exception with missing config
         with self.assertRaises(ValueError):
-            main_function(cloud_event)
+            main_function(CLOUD_EVENT)
 
 
 if __name__ == '__main__':
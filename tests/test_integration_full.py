@@ -1,53 +1,25 @@
 """Comprehensive integration tests with mocked external services"""
-import unittest
-from unittest.mock import Mock, patch, MagicMock
+import itertools
+from contextlib import nullcontext
+from unittest.mock import patch
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator
 
+import pytest
+from cloudevents.http import CloudEvent
+
+from src.config import Config
 from src.main import main_function
 
 
-class TestFullIntegration(unittest.TestCase):
-    """Full integration tests for the AI News Summarizer"""
-    
-    def setUp(self) -> None:
-        """Set up test environment"""
-        self.env_patcher = patch.dict(os.environ, {
-            'OPENROUTER_API_KEY': 'test-api-key',
-            'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test',
-            'GOOGLE_CLOUD_PROJECT': 'test-project',
-            'FIRESTORE_COLLECTION': 'test_collection',
-            'ENVIRONMENT': 'test'
-        })
-        self.env_patcher.start()
-    
-    def tearDown(self) -> None:
-        """Clean up test environment"""
-        self.env_patcher.stop()
-    
-    @patch('src.main.RSSParser')
-    @patch('src.main.WebScraper')
-    @patch('src.main.LLMClient')
-    @patch('src.main.FirestoreClient')
-    @patch('src.main.SlackClient')
-    @patch('src.main.error_reporting.Client')
-    @patch('src.main.signal.alarm')
-    def test_successful_full_workflow(
-        self,
-        mock_alarm: Mock,
-        mock_error_client: Mock,
-        mock_slack: Mock,
-        mock_db: Mock,
-        mock_llm: Mock,
-        mock_scraper: Mock,
-        mock_rss: Mock
-    ) -> None:
-        """Test complete successful workflow with multiple articles and podcasts"""
-        
-        # Mock RSS feeds with multiple items
-        mock_rss_instance = mock_rss.return_value
-        mock_rss_instance.fetch_all_feeds.return_value = {
+# Each scenario feeds main_function a fixed RSS payload and scripted client
+# responses, then checks how far each item got and the footer stats. Content
+# is keyed by URL, so scenarios never depend on the order or number of fetches
+SCENARIOS = [
+    pytest.param({
+        # Multiple articles and podcasts, all processed
+        'feeds': {
             'news': [
                 {
                     'title': 'AI Breakthrough in Healthcare',
@@ -73,102 +45,19 @@ class TestFullIntegration(unittest.TestCase):
                     'feed_type': 'podcast'
                 }
             ]
-        }
-        
-        # Mock web scraper
-        mock_scraper_instance = mock_scraper.return_value
-        mock_scraper_instance.fetch_article_content.side_effect = [
-            "Detailed content about AI in healthcare...",
-            "Analysis of ML market trends..."
-        ]
-        
-        # Mock LLM responses
-        mock_llm_instance = mock_llm.return_value
-        mock_llm_instance.summarize_article.side_effect = [
-            ["AI improves diagnosis accuracy by 95%",
-             "Reduces healthcare costs significantly",
-             "Early detection of diseases enhanced"],
-            ["ML market grows 40% year-over-year",
-             "Enterprise adoption accelerating",
-             "New applications in finance and retail"]
-        ]
-        mock_llm_instance.summarize_podcast.return_value = [
-            "GPT models explained in detail",
-            "Architecture and training process",
-            "Real-world applications discussed"
-        ]
-        mock_llm_instance.generate_ai_tip.return_value = (
-            "Start with simple AI tools before complex implementations"
-        )
-        
-        # Mock Firestore
-        mock_db_instance = mock_db.return_value
-        mock_db_instance.is_url_processed.return_value = False
-        mock_db_instance.mark_url_processed.return_value = True
-        mock_db_instance.initialize_collection = Mock()
-        
-        # Mock Slack
-        mock_slack_instance = mock_slack.return_value
-        mock_slack_instance.send_daily_header.return_value = True
-        mock_slack_instance.send_news_summary.return_value = True
-        mock_slack_instance.send_podcast_summary.return_value = True
-        mock_slack_instance.send_ai_tip.return_value = True
-        mock_slack_instance.send_daily_footer.return_value = True
-        
-        # Create cloud event
-        from cloudevents.http import CloudEvent
-        attributes = {
-            "type": "google.cloud.pubsub.topic.v1.messagePublished",
-            "source": "test-source",
-        }
-        data = {"message": {"data": "test-data"}}
-        cloud_event = CloudEvent(attributes, data)
-        
-        # Execute function
-        main_function(cloud_event)
-        
-        # Verify all components were called correctly
-        mock_rss_instance.fetch_all_feeds.assert_called_once()
-        self.assertEqual(mock_scraper_instance.fetch_article_content.call_count, 2)
-        self.assertEqual(mock_llm_instance.summarize_article.call_count, 2)
-        self.assertEqual(mock_llm_instance.summarize_podcast.call_count, 1)
-        mock_llm_instance.generate_ai_tip.assert_called_once()
-        
-        # Verify Slack messages sent
-        mock_slack_instance.send_daily_header.assert_called_once()
-        self.assertEqual(mock_slack_instance.send_news_summary.call_count, 2)
-        self.assertEqual(mock_slack_instance.send_podcast_summary.call_count, 1)
-        mock_slack_instance.send_ai_tip.assert_called_once()
-        
-        # Verify footer contains correct stats
-        footer_call = mock_slack_instance.send_daily_footer.call_args
-        stats = footer_call[0][0]
-        self.assertEqual(stats['news_count'], 2)
-        self.assertEqual(stats['podcast_count'], 1)
-        self.assertEqual(stats['errors'], 0)
-    
-    @patch('src.main.RSSParser')
-    @patch('src.main.WebScraper')
-    @patch('src.main.LLMClient')
-    @patch('src.main.FirestoreClient')
-    @patch('src.main.SlackClient')
-    @patch('src.main.error_reporting.Client')
-    @patch('src.main.signal.alarm')
-    def test_partial_failures_continue_processing(
-        self,
-        mock_alarm: Mock,
-        mock_error_client: Mock,
-        mock_slack: Mock,
-        mock_db: Mock,
-        mock_llm: Mock,
-        mock_scraper: Mock,
-        mock_rss: Mock
-    ) -> None:
-        """Test that partial failures don't stop processing of other items"""
-        
-        # Mock RSS with 3 articles
-        mock_rss_instance = mock_rss.return_value
-        mock_rss_instance.fetch_all_feeds.return_value = {
+        },
+        'content': {
+            'https://example.com/ai-health': "Detailed content about AI in healthcare...",
+            'https://example.com/ml-market': "Analysis of ML market trends..."
+        },
+        'past_deadline': False,
+        'calls': {'fetch_article_content': 2, 'summarize_article': 2, 'summarize_podcast': 1,
+                  'send_news_summary': 2, 'send_podcast_summary': 1},
+        'stats': {'news_count': 2, 'podcast_count': 1, 'errors': 0},
+    }, id='success'),
+    pytest.param({
+        # The second article has no content; the others are still processed
+        'feeds': {
             'news': [
                 {'title': 'Article 1', 'url': 'https://example.com/1',
                  'feed_name': 'Feed 1', 'feed_type': 'news'},
@@ -178,99 +67,118 @@ class TestFullIntegration(unittest.TestCase):
                  'feed_name': 'Feed 3', 'feed_type': 'news'}
             ],
             'podcast': []
-        }
-        
-        # Mock scraper - second article fails
-        mock_scraper_instance = mock_scraper.return_value
-        mock_scraper_instance.fetch_article_content.side_effect = [
-            "Content 1",
-            None,  # Fail to fetch
-            "Content 3"
-        ]
-        
-        # Mock LLM
-        mock_llm_instance = mock_llm.return_value
-        mock_llm_instance.summarize_article.return_value = ["Summary point"]
-        mock_llm_instance.generate_ai_tip.return_value = "Test tip"
-        
-        # Mock other services
-        mock_db_instance = mock_db.return_value
-        mock_db_instance.is_url_processed.return_value = False
-        mock_db_instance.mark_url_processed.return_value = True
-        
-        mock_slack_instance = mock_slack.return_value
-        mock_slack_instance.send_news_summary.return_value = True
-        
-        # Execute
-        from cloudevents.http import CloudEvent
-        cloud_event = CloudEvent(
-            {"type": "test", "source": "test"},
-            {"message": {"data": "test"}}
-        )
-        main_function(cloud_event)
-        
-        # Verify processing continued despite failure
-        self.assertEqual(mock_scraper_instance.fetch_article_content.call_count, 3)
-        self.assertEqual(mock_llm_instance.summarize_article.call_count, 2)  # Only successful fetches
-        self.assertEqual(mock_slack_instance.send_news_summary.call_count, 2)
-        
-        # Check stats reflect the error
-        footer_call = mock_slack_instance.send_daily_footer.call_args
-        stats = footer_call[0][0]
-        self.assertEqual(stats['news_count'], 2)
-        self.assertEqual(stats['errors'], 0)  # No errors because scraper returned None
-    
-    @patch('src.main.RSSParser')
-    @patch('src.main.WebScraper')
-    @patch('src.main.LLMClient')
-    @patch('src.main.FirestoreClient')
-    @patch('src.main.SlackClient')
-    @patch('src.main.error_reporting.Client')
-    @patch('src.main.signal.alarm')
-    @patch('src.main.time.time')
-    def test_timeout_handling(
-        self,
-        mock_time: Mock,
-        mock_alarm: Mock,
-        mock_error_client: Mock,
-        mock_slack: Mock,
-        mock_db: Mock,
-        mock_llm: Mock,
-        mock_scraper: Mock,
-        mock_rss: Mock
-    ) -> None:
-        """Test graceful timeout handling"""
-        
-        # Mock time to simulate timeout
-        mock_time.side_effect = [0, 500, 510]  # Start, during, timeout
-        
-        # Mock basic setup
-        mock_rss_instance = mock_rss.return_value
-        mock_rss_instance.fetch_all_feeds.return_value = {
-            'news': [{'title': 'Test', 'url': 'https://example.com/test',
-                     'feed_name': 'Test', 'feed_type': 'news'}],
+        },
+        'content': {'https://example.com/1': "Content 1", 'https://example.com/3': "Content 3"},
+        'past_deadline': False,
+        'calls': {'fetch_article_content': 3, 'summarize_article': 2, 'summarize_podcast': 0,
+                  'send_news_summary': 2, 'send_podcast_summary': 0},
+        # No errors because the scraper returned None rather than raising
+        'stats': {'news_count': 2, 'podcast_count': 0, 'errors': 0},
+    }, id='partial'),
+    pytest.param({
+        # The first fetch raises; it is counted as an error and the next article still runs
+        'feeds': {
+            'news': [
+                {'title': 'Slow Article', 'url': 'https://example.com/slow',
+                 'feed_name': 'Feed 1', 'feed_type': 'news'},
+                {'title': 'Fast Article', 'url': 'https://example.com/fast',
+                 'feed_name': 'Feed 2', 'feed_type': 'news'}
+            ],
             'podcast': []
-        }
-        
-        # Simulate timeout during processing
-        def timeout_side_effect(*args: Any, **kwargs: Any) -> None:
-            raise TimeoutError("Test timeout")
-        
-        mock_alarm.side_effect = [None, timeout_side_effect]
-        
-        # Execute - should handle timeout gracefully
-        from cloudevents.http import CloudEvent
-        cloud_event = CloudEvent(
-            {"type": "test", "source": "test"},
-            {"message": {"data": "test"}}
-        )
-        
-        # Function should complete without raising
-        main_function(cloud_event)
-        
-        # Verify alarm was set and cancelled
-        self.assertEqual(mock_alarm.call_count, 2)
+        },
+        'content': {'https://example.com/slow': TimeoutError("Test timeout"),
+                    'https://example.com/fast': "Fast content"},
+        'past_deadline': False,
+        'calls': {'fetch_article_content': 2, 'summarize_article': 1, 'summarize_podcast': 0,
+                  'send_news_summary': 1, 'send_podcast_summary': 0},
+        'stats': {'news_count': 1, 'podcast_count': 0, 'errors': 1},
+    }, id='fetch_error'),
+    pytest.param({
+        # The deadline has passed before the first item, so nothing is started
+        'feeds': {
+            'news': [{'title': 'Test', 'url': 'https://example.com/test',
+                      'feed_name': 'Test', 'feed_type': 'news'}],
+            'podcast': [{'title': 'Episode', 'url': 'https://example.com/episode',
+                         'description': 'Test', 'feed_name': 'Test', 'feed_type': 'podcast'}]
+        },
+        'content': {},
+        'past_deadline': True,
+        'calls': {'fetch_article_content': 0, 'summarize_article': 0, 'summarize_podcast': 0,
+                  'send_news_summary': 0, 'send_podcast_summary': 0},
+        'stats': {'news_count': 0, 'podcast_count': 0, 'errors': 0},
+    }, id='timeout'),
+]
 
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+def _scripted(result: Any) -> Any:
+    """Return a scripted client result, raising it if it is an exception"""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+@pytest.fixture(scope='module', autouse=True)
+def _env() -> Iterator[None]:
+    """Set up the test environment once for the whole module"""
+    # Config reads the environment at import time, so patch its attributes too
+    with patch.dict(os.environ, {
+        'OPENROUTER_API_KEY': 'test-api-key',
+        'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test',
+        'GOOGLE_CLOUD_PROJECT': 'test-project',
+        'FIRESTORE_COLLECTION': 'test_collection',
+        'ENVIRONMENT': 'test'
+    }), patch.multiple(
+        Config,
+        OPENROUTER_API_KEY='test-api-key',
+        SLACK_WEBHOOK_URL='https://hooks.slack.com/test',
+        GCP_PROJECT_ID='test-project',
+        FIRESTORE_COLLECTION='test_collection',
+        ENVIRONMENT='test'
+    ):
+        yield
+
+
+@pytest.fixture(scope='module')
+def cloud_event() -> CloudEvent:
+    """Pub/Sub event handed to main_function; it is only read, so share it"""
+    return CloudEvent({"type": "test", "source": "test"}, {"message": {"data": "test"}})
+
+
+class TestFullIntegration:
+    """Full integration tests for the AI News Summarizer"""
+
+    @pytest.mark.parametrize('scenario', SCENARIOS)
+    def test_workflow(self, main_mocks: SimpleNamespace, cloud_event: CloudEvent, scenario: Dict[str, Any]) -> None:
+        """Test each item is processed or skipped as scripted and the footer stats add up"""
+        main_mocks.rss.return_value.fetch_all_feeds.return_value = scenario['feeds']
+        scraper = main_mocks.scraper.return_value
+        scraper.fetch_article_content.side_effect = lambda url, timeout=None: _scripted(scenario['content'].get(url))
+        llm = main_mocks.llm.return_value
+        llm.summarize_article.side_effect = lambda title, content: [f"Summary of {title}"]
+        llm.summarize_podcast.side_effect = lambda title, description: [f"Summary of {title}"]
+        llm.generate_ai_tip.return_value = "Start with simple AI tools before complex implementations"
+        main_mocks.db.return_value.is_url_processed.return_value = False
+        slack = main_mocks.slack.return_value
+
+        # Each clock reading advances a whole FUNCTION_TIMEOUT, so every loop
+        # check lands past the deadline however often main_function reads it
+        ticks = itertools.count(step=Config.FUNCTION_TIMEOUT)
+        clock = patch('src.main.time.monotonic', side_effect=lambda: next(ticks)) \
+            if scenario['past_deadline'] else nullcontext()
+        with clock:
+            # Function should complete without raising
+            main_function(cloud_event)
+
+        main_mocks.rss.return_value.fetch_all_feeds.assert_called_once()
+        calls = {
+            'fetch_article_content': scraper.fetch_article_content.call_count,
+            'summarize_article': llm.summarize_article.call_count,
+            'summarize_podcast': llm.summarize_podcast.call_count,
+            'send_news_summary': slack.send_news_summary.call_count,
+            'send_podcast_summary': slack.send_podcast_summary.call_count,
+        }
+        assert calls == scenario['calls']
+        slack.send_daily_header.assert_called_once()
+        llm.generate_ai_tip.assert_called_once()
+        slack.send_ai_tip.assert_called_once()
+        slack.send_daily_footer.assert_called_once_with(scenario['stats'])
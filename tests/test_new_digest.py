@@ -1,121 +1,107 @@
 #!/usr/bin/env python3
 """Test the new lighter digest format"""
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import json
+from unittest.mock import patch
+
+import pytest
 
-from src.slack_digest_v2 import SlackDigest
 from src.llm_client import LLMClient
-import logging
-
-logging.basicConfig(level=logging.INFO)
-
-def test_new_digest():
-    """Test the new digest format with sample data"""
-    
-    # Initialize clients
-    digest = SlackDigest()
-    llm_client = LLMClient()
-    
-    # Generate AI tip
-    print("Generating AI tip...")
-    try:
-        ai_tip = llm_client.generate_ai_tip()
-        if ai_tip:
-            digest.set_ai_tip(ai_tip)
-            print(f"✅ AI Tip: {ai_tip}")
-        else:
-            # Use a sample tip if generation fails
-            digest.set_ai_tip("🎯 Try Perplexity's 'Focus' mode for research - it cites sources like Wikipedia or Reddit only. Perfect for fact-checking!")
-            print("✅ Using sample AI tip")
-    except Exception as e:
-        print(f"❌ Error generating AI tip: {e}")
-        digest.set_ai_tip("💡 ChatGPT can analyze photos now! Upload a receipt and ask it to create an expense report. Works in the free version!")
-    
-    # Add sample podcast items
-    sample_podcasts = [
-        {
-            'episode': {
-                'title': 'AI Daily Brief: ChatGPT Gets Voice Mode Upgrade',
-                'url': 'https://example.com/podcast1',
-                'feed_name': 'The AI Daily Brief',
-                'description': 'OpenAI releases major voice mode improvements...'
-            },
-            'summary': [
-                'ChatGPT voice mode now supports 50+ languages with natural accents',
-                'New emotional intelligence features help detect user mood'
-            ]
+
+pytestmark = pytest.mark.unit
+
+SAMPLE_TIP = "🎯 Try Perplexity's 'Focus' mode for research - it cites sources like Wikipedia or Reddit only. Perfect for fact-checking!"
+
+SAMPLE_PODCASTS = [
+    {
+        'episode': {
+            'title': 'AI Daily Brief: ChatGPT Gets Voice Mode Upgrade',
+            'url': 'https://example.com/podcast1',
+            'feed_name': 'The AI Daily Brief',
+            'description': 'OpenAI releases major voice mode improvements...'
         },
-        {
-            'episode': {
-                'title': 'Claude 3.5 Sonnet: The New Coding Champion',
-                'url': 'https://example.com/podcast2',
-                'feed_name': 'AI News in 5 Minutes',
-                'description': 'Anthropic launches Claude 3.5 Sonnet...'
-            },
-            'summary': [
-                'Claude 3.5 beats GPT-4 on coding benchmarks by 15%',
-                'New artifacts feature lets you run code directly in chat'
-            ]
-        }
-    ]
-    
-    for item in sample_podcasts[:2]:  # Limit to 2
-        digest.add_podcast_item(item['episode'], item['summary'])
-        print(f"✅ Added podcast: {item['episode']['title']}")
-    
-    # Add sample news items
-    sample_news = [
-        {
-            'article': {
-                'title': 'Google Adds AI to Gmail Mobile App',
-                'url': 'https://example.com/news1',
-                'feed_name': 'TechCrunch'
-            },
-            'summary': [
-                'Help Me Write feature now available on iOS and Android',
-                'Works offline for basic email drafting tasks'
-            ]
+        'summary': [
+            'ChatGPT voice mode now supports 50+ languages with natural accents',
+            'New emotional intelligence features help detect user mood'
+        ]
+    },
+    {
+        'episode': {
+            'title': 'Claude 3.5 Sonnet: The New Coding Champion',
+            'url': 'https://example.com/podcast2',
+            'feed_name': 'AI News in 5 Minutes',
+            'description': 'Anthropic launches Claude 3.5 Sonnet...'
         },
-        {
-            'article': {
-                'title': 'Perplexity Launches Pro Search for Free Users',
-                'url': 'https://example.com/news2',
-                'feed_name': 'The Verge'
-            },
-            'summary': [
-                'Five free Pro searches per day for all users',
-                'Includes multi-step reasoning and code execution'
-            ]
-        }
-    ]
-    
-    for item in sample_news[:2]:  # Limit to 2
+        'summary': [
+            'Claude 3.5 beats GPT-4 on coding benchmarks by 15%',
+            'New artifacts feature lets you run code directly in chat'
+        ]
+    }
+]
+
+SAMPLE_NEWS = [
+    {
+        'article': {
+            'title': 'Google Adds AI to Gmail Mobile App',
+            'url': 'https://example.com/news1',
+            'feed_name': 'TechCrunch'
+        },
+        'summary': [
+            'Help Me Write feature now available on iOS and Android',
+            'Works offline for basic email drafting tasks'
+        ]
+    },
+    {
+        'article': {
+            'title': 'Perplexity Launches Pro Search for Free Users',
+            'url': 'https://example.com/news2',
+            'feed_name': 'The Verge'
+        },
+        'summary': [
+            'Five free Pro searches per day for all users',
+            'Includes multi-step reasoning and code execution'
+        ]
+    }
+]
+
+
+@patch.object(LLMClient, 'generate_ai_tip', return_value=SAMPLE_TIP)
+def test_build_digest_structure(mock_tip, digest, llm, stub_webhook):
+    """Test the digest holds the tip, podcasts and news and posts once"""
+    digest.set_ai_tip(llm.generate_ai_tip())
+    for item in SAMPLE_PODCASTS:
+        digest.add_podcast_item(item['episode'], item['summary'])
+    for item in SAMPLE_NEWS:
         digest.add_news_item(item['article'], item['summary'])
-        print(f"✅ Added news: {item['article']['title']}")
-    
-    # Build and preview the digest
-    print("\n📋 Building digest...")
+
     blocks = digest.build_digest()
-    
-    # Show a preview of the message structure
-    print(f"\n📊 Digest structure:")
-    print(f"- Total blocks: {len(blocks)}")
-    print(f"- AI Tip: {'Yes' if digest.ai_tip else 'No'}")
-    print(f"- Podcasts: {len(digest.podcast_items)}")
-    print(f"- News: {len(digest.news_items)}")
-    
-    # Send the digest
-    print("\n📤 Sending digest to Slack...")
-    success = digest.send_digest()
-    
-    if success:
-        print("✅ Digest sent successfully!")
-    else:
-        print("❌ Failed to send digest")
-    
-    return success
+
+    assert len(blocks) > 0
+    assert digest.ai_tip is not None
+    assert len(digest.podcast_items) == 2
+    assert len(digest.news_items) == 2
+
+    assert digest.send_digest() is True
+    stub_webhook.post.assert_called_once()
+    payload = json.loads(stub_webhook.post.call_args.kwargs['data'])
+    assert payload['blocks'] == blocks
+    assert payload['text'] == "AI Daily Digest - 2 articles, 2 podcasts"
+
+
+def test_empty_digest_not_sent(digest, stub_webhook):
+    """Test a digest with no content is never posted"""
+    assert digest.send_digest() is False
+    stub_webhook.post.assert_not_called()
+
+
+@pytest.mark.parametrize('status_code, expected', [(200, True), (500, False)])
+def test_send_digest_reports_webhook_status(digest, stub_webhook, status_code, expected):
+    """Test send_digest returns whether Slack accepted the post"""
+    stub_webhook.post.return_value.status_code = status_code
+    digest.set_ai_tip(SAMPLE_TIP)
+
+    assert digest.send_digest() is expected
+
 
 if __name__ == "__main__":
-    test_new_digest()
\ No newline at end of file
+    pytest.main([__file__])
@@ -1,95 +1,200 @@
 #!/usr/bin/env python3
 """Test script to verify RSS feed URLs are working"""
 
+import asyncio
+import pytest
 import feedparser
+import re
 import requests
+import responses
 from datetime import datetime
+from typing import Dict, List
 import sys
 import os
 
+# aiohttp is optional; without it the live checks run one feed at a time
+try:
+    import aiohttp
+    HAVE_AIOHTTP = True
+except ImportError:  # pragma: no cover - exercised only without the extra
+    aiohttp = None  # type: ignore[assignment]
+    HAVE_AIOHTTP = False
+
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import Config
 
+ALL_FEEDS = Config.NEWS_FEEDS + Config.PODCAST_FEEDS
+
+USER_AGENT = 'AI-News-Summarizer/1.0'
+
+
+def feed_slug(feed_name: str) -> str:
+    """Fixture file stem for a feed, e.g. 'AI News in 5 Minutes' -> 'ai-news-in-5-minutes'"""
+    return re.sub(r'[^a-z0-9]+', '-', feed_name.lower()).strip('-')
 
-def test_rss_feed(feed_url: str, feed_name: str) -> bool:
-    """Test if an RSS feed is accessible and valid"""
+
+def fetch_feed(feed_url: str) -> feedparser.FeedParserDict:
+    """Download and parse a feed the way the checks below do"""
+    response = requests.get(feed_url, timeout=10, headers={'User-Agent': USER_AGENT})
+    response.raise_for_status()
+    return feedparser.parse(response.content)
+
+
+def report_feed(feed: feedparser.FeedParserDict, feed_url: str, feed_name: str) -> bool:
+    """Print a downloaded feed's details and return whether it is valid"""
     print(f"\n🔍 Testing RSS feed: {feed_name}")
     print(f"   URL: {feed_url}")
+    print("   ✅ Feed is accessible")
 
-    try:
-        # First try with requests to check accessibility
-        response = requests.get(feed_url, timeout=10, headers={
-            'User-Agent': 'AI-News-Summarizer/1.0'
-        })
-        response.raise_for_status()
-        print(f"   ✅ Feed is accessible (Status: {response.status_code})")
-
-        # Parse the feed
-        feed = feedparser.parse(response.content)
+    if feed.bozo:
+        print(f"   ⚠️  Feed parsing warning: {feed.bozo_exception}")
+        return False
 
-        if feed.bozo:
-            print(f"   ⚠️  Feed parsing warning: {feed.bozo_exception}")
-            return False
+    # Check feed details
+    feed_title = feed.feed.get('title', 'Unknown')
+    print(f"   📰 Feed Title: {feed_title}")
 
-        # Check feed details
-        feed_title = feed.feed.get('title', 'Unknown')
-        print(f"   📰 Feed Title: {feed_title}")
+    # Check entries
+    entry_count = len(feed.entries)
+    print(f"   📊 Number of episodes/articles: {entry_count}")
 
-        # Check entries
-        entry_count = len(feed.entries)
-        print(f"   📊 Number of episodes/articles: {entry_count}")
+    if entry_count > 0:
+        # Show latest entry
+        latest = feed.entries[0]
+        print(f"\n   📌 Latest Episode:")
+        print(f"      Title: {latest.get('title', 'No title')}")
 
-        if entry_count > 0:
-            # Show latest entry
-            latest = feed.entries[0]
-            print(f"\n   📌 Latest Episode:")
-            print(f"      Title: {latest.get('title', 'No title')}")
+        # Try to get publication date
+        pub_date = None
+        if hasattr(latest, 'published_parsed') and latest.published_parsed:
+            pub_date = datetime.fromtimestamp(latest.published_parsed[0])
+        elif hasattr(latest, 'updated_parsed') and latest.updated_parsed:
+            pub_date = datetime.fromtimestamp(latest.updated_parsed[0])
 
-            # Try to get publication date
-            pub_date = None
-            if hasattr(latest, 'published_parsed') and latest.published_parsed:
-                pub_date = datetime.fromtimestamp(latest.published_parsed[0])
-            elif hasattr(latest, 'updated_parsed') and latest.updated_parsed:
-                pub_date = datetime.fromtimestamp(latest.updated_parsed[0])
+        if pub_date:
+            print(f"      Published: {pub_date.strftime('%Y-%m-%d %H:%M')}")
 
-            if pub_date:
-                print(f"      Published: {pub_date.strftime('%Y-%m-%d %H:%M')}")
+        # Check description
+        description = latest.get('summary', latest.get('description', ''))
+        if description:
+            print(f"      Description: {description[:100]}...")
 
-            # Check description
-            description = latest.get('summary', latest.get('description', ''))
-            if description:
-                print(f"      Description: {description[:100]}...")
+        print(f"      Link: {latest.get('link', 'No link')}")
 
-            print(f"      Link: {latest.get('link', 'No link')}")
+    return True
 
-        return True
 
+def check_rss_feed(feed_url: str, feed_name: str) -> bool:
+    """Check if an RSS feed is accessible and valid"""
+    try:
+        return report_feed(fetch_feed(feed_url), feed_url, feed_name)
     except requests.RequestException as e:
-        print(f"   ❌ Error fetching feed: {e}")
+        print(f"\n🔍 Testing RSS feed: {feed_name}\n   ❌ Error fetching feed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n🔍 Testing RSS feed: {feed_name}\n   ❌ Unexpected error: {e}")
+        return False
+
+
+async def check_rss_feed_async(session: "aiohttp.ClientSession", feed_url: str, feed_name: str) -> bool:
+    """check_rss_feed over a shared aiohttp session, so many feeds can be checked at once"""
+    try:
+        async with session.get(feed_url) as response:
+            response.raise_for_status()
+            body = await response.read()
+        # Each report prints in one go once its download finishes, so output never interleaves
+        return report_feed(feedparser.parse(body), feed_url, feed_name)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"\n🔍 Testing RSS feed: {feed_name}\n   ❌ Error fetching feed: {e!r}")
         return False
     except Exception as e:
-        print(f"   ❌ Unexpected error: {e}")
+        print(f"\n🔍 Testing RSS feed: {feed_name}\n   ❌ Unexpected error: {e}")
         return False
 
 
+async def check_all_feeds(feeds: List[Dict[str, str]]) -> List[bool]:
+    """Check every feed concurrently; wall time is the slowest feed, not the sum"""
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10),
+                                     headers={'User-Agent': USER_AGENT}) as session:
+        return await asyncio.gather(*(check_rss_feed_async(session, feed['url'], feed['name'])
+                                      for feed in feeds))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("feed", ALL_FEEDS, ids=lambda f: feed_slug(f['name']))
+@responses.activate
+def test_rss_feed(feed, rss_fixtures):
+    """Test every configured feed parses from its recorded fixture"""
+    responses.add(
+        responses.GET, feed['url'],
+        body=rss_fixtures[feed_slug(feed['name'])],
+        status=200, content_type='application/rss+xml'
+    )
+
+    parsed = fetch_feed(feed['url'])
+
+    assert not parsed.bozo, parsed.get('bozo_exception')
+    assert len(parsed.entries) > 0
+    assert parsed.entries[0].get('title')
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not HAVE_AIOHTTP, reason="aiohttp not installed")
+def test_check_all_feeds_concurrent(rss_fixtures):
+    """Test the concurrent checker against a local server, one feed missing"""
+    from aiohttp import web
+
+    async def handler(request):
+        body = rss_fixtures.get(request.match_info['slug'])
+        if body is None:
+            raise web.HTTPNotFound()
+        return web.Response(body=body, content_type='application/rss+xml')
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/{slug}', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            feeds = [{'name': name, 'url': f'http://127.0.0.1:{port}/{feed_slug(name)}'}
+                     for name in ('TechCrunch AI', 'The AI Daily Brief', 'Missing Feed')]
+            return await check_all_feeds(feeds)
+        finally:
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == [True, True, False]
+
+
+@pytest.mark.external_api
+@pytest.mark.skipif(not HAVE_AIOHTTP, reason="aiohttp not installed")
+def test_rss_feeds_live():
+    """Test every configured feed is reachable and valid (needs --external-api)"""
+    results = asyncio.run(check_all_feeds(ALL_FEEDS))
+
+    failed = [feed['name'] for feed, ok in zip(ALL_FEEDS, results) if not ok]
+    assert failed == []
+
+
 def main():
     """Test all configured RSS feeds"""
     print("=" * 60)
     print("🧪 RSS Feed Testing Tool")
     print("=" * 60)
 
-    all_feeds = Config.NEWS_FEEDS + Config.PODCAST_FEEDS
+    all_feeds = ALL_FEEDS
 
-    success_count = 0
-    failed_feeds = []
+    if HAVE_AIOHTTP:
+        results = asyncio.run(check_all_feeds(all_feeds))
+    else:
+        results = [check_rss_feed(feed['url'], feed['name']) for feed in all_feeds]
 
-    for feed in all_feeds:
-        if test_rss_feed(feed['url'], feed['name']):
-            success_count += 1
-        else:
-            failed_feeds.append(feed['name'])
+    success_count = sum(results)
+    failed_feeds = [feed['name'] for feed, ok in zip(all_feeds, results) if not ok]
 
     # Summary
     print("\n" + "=" * 60)
@@ -106,7 +211,7 @@ def main():
     # Special test for the new podcast
     print("\n" + "=" * 60)
     print("🎯 Special Test: AI News in 5 Minutes or Less")
-    test_rss_feed(
+    check_rss_feed(
         "https://feeds.transistor.fm/ai-news-in-5-minutes-or-less",
         "AI News in 5 Minutes or Less (Direct Test)"
     )
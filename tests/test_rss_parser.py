@@ -1,122 +1,218 @@
-import unittest
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 import feedparser
+import pytest
+import requests
+import responses
 
+from src.config import Config
 from src.rss_parser import RSSParser
 
+NEWS_URL_1, NEWS_URL_2 = (feed['url'] for feed in Config.NEWS_FEEDS[:2])
+PODCAST_URL_1 = Config.PODCAST_FEEDS[0]['url']
 
-class TestRSSParser(unittest.TestCase):
+MAX_RETRIES = 2
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() sits between the two rss_small.xml items"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 1, 6, 15, 0)
+
+
+@pytest.fixture(scope='module')
+def good_response(rss_fixtures):
+    """A 200 response serving rss_small.xml; fetch_feed only reads it, so share it"""
+    return Mock(status_code=200, headers={}, content=rss_fixtures['rss_small'], raise_for_status=Mock())
+
+
+@pytest.fixture(scope='module')
+def make_entry():
+    """Factory for feed entries published a given age before FrozenDatetime.now()"""
+    now = FrozenDatetime.now()
+
+    def _make(title, age, link='https://example.com/post', summary='<p>Summary</p>'):
+        # Keyword construction skips FeedParserDict's per-attribute __setattr__
+        return feedparser.FeedParserDict(title=title, link=link, summary=summary,
+                                         published_parsed=(now - age).timetuple())
+    return _make
+
+
+class TestRSSParser:
     """Test RSS parser module"""
 
-    def setUp(self):
-        self.parser = RSSParser()
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path, rss_fixtures, parsed_fixtures):
+        self.cache_path = str(tmp_path / 'feed_cache.json')
+        # Zero backoff so adapter retries never sleep
+        self.parser = RSSParser(cache_path=self.cache_path, max_retries=MAX_RETRIES, backoff_factor=0)
+        self.rss_small = rss_fixtures['rss_small']
+        self.parsed_feed = parsed_fixtures['rss_small']
 
-    @patch('src.rss_parser.requests.Session')
-    def test_fetch_feed_success(self, mock_session):
+    def test_fetch_feed_success(self, good_response):
         """Test successful feed fetching"""
-        # Mock response
-        mock_response = Mock()
-        mock_response.content = b'<rss><channel><title>Test Feed</title></channel></rss>'
-        mock_response.raise_for_status = Mock()
-
-        mock_session.return_value.get.return_value = mock_response
+        self.parser.session = Mock()
+        self.parser.session.get.return_value = good_response
 
         # Test fetch
         result = self.parser.fetch_feed('http://test.com/feed', 'Test Feed')
 
-        self.assertIsNotNone(result)
-        self.assertIsInstance(result, feedparser.FeedParserDict)
+        assert result is not None
+        assert isinstance(result, feedparser.FeedParserDict)
+        assert result.feed.title == self.parsed_feed.feed.title
+
+    def test_session_mounts_retry_adapter(self):
+        """Test retries are delegated to the pooled urllib3 adapter"""
+        for prefix in ('http://', 'https://'):
+            adapter = self.parser.session.get_adapter(prefix + 'test.com/feed')
+            assert adapter.max_retries.total == MAX_RETRIES - 1
+            assert adapter.max_retries.backoff_factor == 0
+            assert 503 in adapter.max_retries.status_forcelist
+
+    def test_default_retry_policy_from_config(self):
+        """Test each feed gets Config.MAX_RETRIES attempts in total by default"""
+        parser = RSSParser(cache_path=self.cache_path)
+        assert parser.session.get_adapter('https://test.com/feed').max_retries.total == Config.MAX_RETRIES - 1
+
+    @responses.activate
+    def test_fetch_feed_retry_on_error(self):
+        """Test a 503 is retried by the adapter until the feed is served"""
+        responses.add(responses.GET, 'http://test.com/feed', status=503)
+        responses.add(responses.GET, 'http://test.com/feed', body=self.rss_small, status=200)
 
-    @patch('src.rss_parser.requests.Session')
-    def test_fetch_feed_retry_on_error(self, mock_session):
-        """Test retry logic on network error"""
-        # Mock failed requests
-        mock_session.return_value.get.side_effect = [
-            Exception("Network error"),
-            Exception("Network error"),
-            Mock(content=b'<rss></rss>', raise_for_status=Mock())
-        ]
+        result = self.parser.fetch_feed('http://test.com/feed', 'Test Feed')
 
-        with patch('time.sleep'):  # Speed up test by mocking sleep
-            result = self.parser.fetch_feed('http://test.com/feed', 'Test Feed')
+        assert result is not None
+        assert result.feed.title == self.parsed_feed.feed.title
+        assert len(responses.calls) == 2
 
-        self.assertIsNotNone(result)
-        self.assertEqual(mock_session.return_value.get.call_count, 3)
+    @responses.activate
+    def test_fetch_feed_retries_exhausted(self):
+        """Test persistent 503s give up after max_retries attempts and return None"""
+        responses.add(responses.GET, 'http://test.com/feed', status=503)
 
-    def test_extract_feed_items(self):
-        """Test extracting items from parsed feed"""
-        # Create mock feed
-        mock_feed = feedparser.FeedParserDict()
-        mock_feed.entries = []
-
-        # Add recent entry
-        recent_entry = feedparser.FeedParserDict()
-        recent_entry.title = "Recent Article"
-        recent_entry.link = "http://test.com/recent"
-        recent_entry.summary = "This is a recent article"
-        recent_entry.published_parsed = (datetime.now() - timedelta(hours=1)).timetuple()
-        mock_feed.entries.append(recent_entry)
-
-        # Add old entry
-        old_entry = feedparser.FeedParserDict()
-        old_entry.title = "Old Article"
-        old_entry.link = "http://test.com/old"
-        old_entry.summary = "This is an old article"
-        old_entry.published_parsed = (datetime.now() - timedelta(days=2)).timetuple()
-        mock_feed.entries.append(old_entry)
+        assert self.parser.fetch_feed('http://test.com/feed', 'Test Feed') is None
+        assert len(responses.calls) == MAX_RETRIES
 
-        feed_config = {'name': 'Test Feed', 'type': 'news'}
-        items = self.parser.extract_feed_items(mock_feed, feed_config, hours_back=24)
+    def test_fetch_feed_returns_none_on_error(self):
+        """Test network errors surface as None after adapter retries"""
+        self.parser.session = Mock()
+        self.parser.session.get.side_effect = requests.ConnectionError("Network error")
 
-        # Should only get recent article
-        self.assertEqual(len(items), 1)
-        self.assertEqual(items[0]['title'], "Recent Article")
-        self.assertEqual(items[0]['feed_name'], "Test Feed")
+        result = self.parser.fetch_feed('http://test.com/feed', 'Test Feed')
 
-    def test_clean_description(self):
-        """Test HTML cleaning from descriptions"""
-        html_description = """
-        <p>This is a <strong>test</strong> description.</p>
-        <div>With multiple lines</div>
-        <script>alert('bad')</script>
-        """
+        assert result is None
+        assert self.parser.session.get.call_count == 1
+
+    def test_fetch_feed_conditional_get(self):
+        """Test validators are cached and a 304 skips parsing"""
+        ok_response = Mock(status_code=200, content=b'<rss></rss>',
+                           headers={'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        self.parser.session = Mock()
+        self.parser.session.get.return_value = ok_response
+
+        assert self.parser.fetch_feed('http://test.com/feed', 'Test Feed') is not None
+
+        # A fresh parser picks up the validators persisted to disk
+        parser = RSSParser(cache_path=self.cache_path)
+        parser.session = Mock()
+        parser.session.get.return_value = Mock(status_code=304)
+
+        with patch('src.rss_parser.feedparser.parse') as mock_parse:
+            result = parser.fetch_feed('http://test.com/feed', 'Test Feed')
 
-        cleaned = self.parser._clean_description(html_description)
+        assert result is None
+        mock_parse.assert_not_called()
+        assert 'http://test.com/feed' in parser.unchanged_feeds
+        headers = parser.session.get.call_args.kwargs['headers']
+        assert headers['If-None-Match'] == '"abc"'
+        assert headers['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
 
-        self.assertNotIn('<p>', cleaned)
-        self.assertNotIn('<strong>', cleaned)
-        self.assertNotIn('<script>', cleaned)
-        self.assertIn('This is a test description.', cleaned)
-        self.assertIn('With multiple lines', cleaned)
+    def test_extract_feed_items(self):
+        """Test extracting items from parsed feed"""
+        # The recent entry is an hour old and the old one two days old at this "now"
+        feed_config = {'name': 'Test Feed', 'type': 'news'}
+        with patch('src.rss_parser.datetime', FrozenDatetime):
+            items = self.parser.extract_feed_items(self.parsed_feed, feed_config, hours_back=24)
 
+        # Should only get recent article
+        assert len(items) == 1
+        assert items[0]['title'] == "Recent Article"
+        assert items[0]['feed_name'] == "Test Feed"
+
+    @pytest.mark.parametrize('age, kept', [
+        (timedelta(hours=1), True),
+        (timedelta(hours=23, minutes=59), True),
+        (timedelta(hours=24, minutes=1), False),
+        (timedelta(days=7), False),
+    ])
+    def test_extract_feed_items_cutoff(self, make_entry, age, kept):
+        """Test entries are kept only inside the hours_back window"""
+        feed = feedparser.FeedParserDict(entries=[make_entry('Entry', age)])
+        with patch('src.rss_parser.datetime', FrozenDatetime):
+            items = self.parser.extract_feed_items(feed, {'name': 'Test Feed', 'type': 'news'}, hours_back=24)
+
+        assert [item['title'] for item in items] == (['Entry'] if kept else [])
+
+    def test_extract_feed_items_skips_entries_without_link(self, make_entry):
+        """Test entries with no link are dropped"""
+        feed = feedparser.FeedParserDict(entries=[make_entry('No Link', timedelta(hours=1), link=''),
+                                                  make_entry('Linked', timedelta(hours=1))])
+        with patch('src.rss_parser.datetime', FrozenDatetime):
+            items = self.parser.extract_feed_items(feed, {'name': 'Test Feed', 'type': 'news'})
+
+        assert [item['title'] for item in items] == ['Linked']
+        assert items[0]['description'] == 'Summary'
+
+    @pytest.mark.parametrize('feed_items', [
+        pytest.param({}, id='empty'),
+        pytest.param({NEWS_URL_1: [{'title': 'News 1', 'url': 'http://news1.com'}]}, id='single'),
+        pytest.param({
+            NEWS_URL_1: [{'title': 'News 1', 'url': 'http://news1.com'}],
+            NEWS_URL_2: [{'title': 'News 2', 'url': 'http://news2.com'},
+                         {'title': 'News 3', 'url': 'http://news3.com'}],
+            PODCAST_URL_1: [{'title': 'Podcast 1', 'url': 'http://podcast1.com'}],
+        }, id='many'),
+    ])
     @patch.object(RSSParser, 'fetch_feed')
     @patch.object(RSSParser, 'extract_feed_items')
-    def test_fetch_all_feeds(self, mock_extract, mock_fetch):
-        """Test fetching all configured feeds"""
-        # Mock feed responses
-        mock_feed = feedparser.FeedParserDict()
-        mock_fetch.return_value = mock_feed
-
-        # Mock extracted items
-        mock_extract.side_effect = [
-            [{'title': 'News 1', 'url': 'http://news1.com'}],  # First news feed
-            [{'title': 'News 2', 'url': 'http://news2.com'}],  # Second news feed
-            [],  # Empty feed
-            [],  # Empty feed
-            [],  # Empty feed
-            [{'title': 'Podcast 1', 'url': 'http://podcast1.com'}],  # First podcast
-            [],  # Empty feed
-            []   # Empty feed
-        ]
+    def test_fetch_all_feeds(self, mock_extract, mock_fetch, feed_items):
+        """Test items from every configured feed are collected by type, in feed order"""
+        mock_fetch.return_value = self.parsed_feed
+
+        # Items are looked up by feed URL, so adding feeds to Config needs no test edits
+        def extract(feed, feed_config, hours_back=24):
+            return feed_items.get(feed_config['url'], [])
+        mock_extract.side_effect = extract
 
         result = self.parser.fetch_all_feeds()
 
-        self.assertEqual(len(result['news']), 2)
-        self.assertEqual(len(result['podcast']), 1)
-        self.assertEqual(result['news'][0]['title'], 'News 1')
-        self.assertEqual(result['podcast'][0]['title'], 'Podcast 1')
+        assert mock_extract.call_count == len(Config.NEWS_FEEDS) + len(Config.PODCAST_FEEDS)
+        for feed_type, feeds in (('news', Config.NEWS_FEEDS), ('podcast', Config.PODCAST_FEEDS)):
+            expected = [item for feed in feeds for item in feed_items.get(feed['url'], [])]
+            assert result[feed_type] == expected
 
 
-if __name__ == '__main__':
-    unittest.main()
+@pytest.mark.parametrize('raw, expected', [
+    pytest.param("""
+        <p>This is a <strong>test</strong> description.</p>
+        <div>With multiple lines</div>
+        <script>alert('bad')</script>
+        """, "This is a test description. With multiple lines", id='mixed-html'),
+    pytest.param("<p>A <strong>b</strong></p>", "A b", id='inline-tags'),
+    pytest.param("<script>bad</script>hi", "hi", id='script'),
+    pytest.param("<div>one</div><div>two</div>", "onetwo", id='adjacent-blocks'),
+    pytest.param("<p>one</p>\n<p>two</p>", "one two", id='blocks-on-lines'),
+    pytest.param("a<br/>b", "ab", id='line-break'),
+    pytest.param("See <a href='https://example.com'>link</a>.", "See link.", id='inline-punctuation'),
+    pytest.param("foo<b>bar</b>", "foobar", id='inline-word'),
+    pytest.param("<p>line\n   two</p>", "line two", id='inner-whitespace'),
+    pytest.param("Tom &amp; Jerry", "Tom & Jerry", id='entity'),
+    pytest.param("  plain text  ", "plain text", id='plain-text'),
+    pytest.param("", "", id='empty'),
+])
+def test_clean_description(rss, raw, expected):
+    """Test HTML cleaning from descriptions, sharing the session parser"""
+    assert rss._clean_description(raw) == expected
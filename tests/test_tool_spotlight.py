@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test the tool spotlight feature"""
 
+import pytest
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -10,6 +11,9 @@ import logging
 
 logging.basicConfig(level=logging.INFO)
 
+pytestmark = pytest.mark.network
+
+
 def test_tool_extraction():
     """Test extracting tools from articles"""
     llm_client = LLMClient()
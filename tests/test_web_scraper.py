@@ -0,0 +1,314 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from src.web_scraper import HAVE_AIOHTTP, HAVE_SELECTOLAX, WebScraper
+
+
+PARAGRAPH = "Researchers released a new open model that beats prior baselines. " * 5
+
+ARTICLE_HTML = f"""
+<html>
+<head>
+    <title>New Model Released</title>
+    <meta name="description" content="A short summary">
+    <meta property="og:title" content="OG Title">
+    <meta property="og:description" content="OG Description">
+    <script>var tracking = true;</script>
+</head>
+<body>
+    <nav>Home | About</nav>
+    <article>
+        <h1>New Model Released</h1>
+        <p>{PARAGRAPH}</p>
+        <p>Second paragraph with more detail.</p>
+    </article>
+    <footer>Copyright</footer>
+</body>
+</html>
+"""
+
+
+class TestWebScraper(unittest.TestCase):
+    """Test article extraction from HTML"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.cache_path = os.path.join(self.cache_dir.name, 'articles.sqlite3')
+        self.scraper = WebScraper(cache_path=self.cache_path)
+        self.addCleanup(self.scraper.close)
+        # Don't let the scraper rate limiter sleep between fetch tests
+        sleep_patcher = patch('src.rate_limiter.time.sleep')
+        sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def test_instances_share_pooled_session(self):
+        """Test scrapers reuse one process-wide session and connection pool"""
+        with WebScraper(cache_path=self.cache_path) as scraper:
+            self.assertIs(scraper.session, self.scraper.session)
+        adapter = self.scraper.session.get_adapter('https://example.com/')
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertEqual(self.scraper.session.headers['Accept'], 'text/html,application/xhtml+xml')
+
+    def test_cache_opened_lazily_and_closed(self):
+        """Test the article cache opens on first use and close releases it"""
+        with patch('src.web_scraper.sqlite3.connect', wraps=sqlite3.connect) as mock_connect:
+            scraper = WebScraper(cache_path=self.cache_path)
+            mock_connect.assert_not_called()
+
+            conn = scraper._cache
+            self.assertIsNone(scraper._cached_article('https://example.com/post'))
+            mock_connect.assert_called_once_with(self.cache_path)
+
+        scraper.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
+        scraper.close()  # Closing twice is harmless
+
+    def test_extract_content_from_article(self):
+        """Test the article body is extracted without page chrome"""
+        text = self.scraper._extract_content(ARTICLE_HTML, 'https://example.com/post')
+
+        self.assertIsNotNone(text)
+        self.assertIn('Researchers released a new open model', text)
+        self.assertIn('Second paragraph with more detail.', text)
+        self.assertNotIn('Home | About', text)
+        self.assertNotIn('tracking', text)
+        self.assertNotIn('Copyright', text)
+
+    def test_site_specific_extraction(self):
+        """Test known sites use their own content container"""
+        html = f'<html><body><div class="c-entry-content"><p>{PARAGRAPH}</p></div></body></html>'
+
+        text = self.scraper._extract_content(html, 'https://www.theverge.com/2024/1/1/story')
+
+        self.assertIsNotNone(text)
+        self.assertIn('Researchers released', text)
+
+    def test_largest_text_block_fallback(self):
+        """Test pages without known containers fall back to paragraph groups"""
+        html = f'<html><body><div><p>Short</p></div><div><p>{PARAGRAPH}</p><p>{PARAGRAPH}</p></div></body></html>'
+
+        text = self.scraper._extract_content(html, 'https://example.com/post')
+
+        self.assertIsNotNone(text)
+        self.assertIn('Researchers released', text)
+
+    def test_short_content_rejected(self):
+        """Test pages with too little text return None"""
+        html = '<html><body><article><p>Too short</p></article></body></html>'
+
+        self.assertIsNone(self.scraper._extract_content(html, 'https://example.com/post'))
+
+    def test_clean_text(self):
+        """Test whitespace is normalized and long text truncated"""
+        self.assertEqual(self.scraper._clean_text('  a  \n\n\n\n  b \n'), 'a\nb')
+
+        cleaned = self.scraper._clean_text('x' * 6000)
+        self.assertEqual(len(cleaned), 5003)
+        self.assertTrue(cleaned.endswith('...'))
+
+    def test_clean_text_long_whitespace_run_is_linear(self):
+        """Test a huge whitespace run without line breaks is cleaned quickly"""
+        text = 'word ' + '\t ' * 200000 + 'end'
+
+        start = time.perf_counter()
+        cleaned = self.scraper._clean_text(text)
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertTrue(cleaned.startswith('word'))
+        self.assertTrue(cleaned.endswith('...'))
+
+    def test_extract_metadata(self):
+        """Test title, description and Open Graph tags are read"""
+        metadata = self.scraper.extract_metadata(ARTICLE_HTML)
+
+        self.assertEqual(metadata['title'], 'New Model Released')
+        self.assertEqual(metadata['description'], 'A short summary')
+        self.assertEqual(metadata['og_title'], 'OG Title')
+        self.assertEqual(metadata['og_description'], 'OG Description')
+
+    @unittest.skipUnless(HAVE_SELECTOLAX, "selectolax not installed")
+    def test_fast_path_matches_beautifulsoup(self):
+        """Test the selectolax path yields the same text and metadata as BeautifulSoup"""
+        html = f'<main><div>Intro <b>bold</b> text</div><p>{PARAGRAPH} &amp; more</p></main>'
+
+        fast = self.scraper._extract_content(html, 'https://example.com/post')
+        fast_metadata = self.scraper.extract_metadata(ARTICLE_HTML)
+        with patch('src.web_scraper.HAVE_SELECTOLAX', False):
+            slow = self.scraper._extract_content(html, 'https://example.com/post')
+            slow_metadata = self.scraper.extract_metadata(ARTICLE_HTML)
+
+        self.assertEqual(fast, slow)
+        self.assertEqual(fast_metadata, slow_metadata)
+
+    def test_fetch_article_content_decodes_streamed_body(self):
+        """Test streamed chunks are joined and decoded once before extraction"""
+        body = ARTICLE_HTML.replace('beats', 'béats').encode('utf-8')
+        response = Mock(headers={}, encoding='utf-8')
+        response.iter_content.return_value = [body[i:i + 100] for i in range(0, len(body), 100)]
+        self.scraper.session = Mock()
+        self.scraper.session.get.return_value = response
+
+        text = self.scraper.fetch_article_content('https://example.com/post')
+
+        self.assertIn('béats prior baselines', text)
+
+    def test_fetch_article_content_conditional_get(self):
+        """Test validators are cached and a 304 returns the cached text"""
+        response = Mock(headers={'ETag': '"v1"'}, encoding='utf-8', status_code=200)
+        response.iter_content.return_value = [ARTICLE_HTML.encode('utf-8')]
+        self.scraper.session = Mock()
+        self.scraper.session.get.return_value = response
+
+        first = self.scraper.fetch_article_content('https://example.com/post')
+
+        # A fresh scraper picks up the cache persisted to disk
+        scraper = WebScraper(cache_path=self.cache_path)
+        self.addCleanup(scraper.close)
+        scraper.session = Mock()
+        scraper.session.get.return_value = Mock(status_code=304)
+
+        with patch.object(WebScraper, '_extract_content') as mock_extract:
+            second = scraper.fetch_article_content('https://example.com/post')
+
+        self.assertEqual(second, first)
+        mock_extract.assert_not_called()
+        headers = scraper.session.get.call_args.kwargs['headers']
+        self.assertEqual(headers, {'If-None-Match': '"v1"'})
+
+    def test_fetch_article_content_rejects_oversized_body(self):
+        """Test bodies past MAX_CONTENT_LENGTH are dropped while streaming"""
+        response = Mock(headers={}, encoding='utf-8')
+        response.iter_content.return_value = iter([b'x' * 8192] * 2)
+        self.scraper.session = Mock()
+        self.scraper.session.get.return_value = response
+
+        with patch('src.web_scraper.MAX_CONTENT_LENGTH', 10000):
+            self.assertIsNone(self.scraper.fetch_article_content('https://example.com/big'))
+
+    def test_fetch_many_without_aiohttp_falls_back(self):
+        """Test fetch_many degrades to sequential fetches without aiohttp"""
+        urls = ['https://example.com/a', 'https://example.com/b']
+
+        with patch('src.web_scraper.HAVE_AIOHTTP', False), \
+                patch.object(WebScraper, 'fetch_article_content', side_effect=['A', None]) as mock_fetch:
+            result = asyncio.run(self.scraper.fetch_many(urls))
+
+        self.assertEqual(result, {'https://example.com/a': 'A', 'https://example.com/b': None})
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    @unittest.skipUnless(HAVE_AIOHTTP, "aiohttp not installed")
+    def test_fetch_many_survives_extraction_error(self):
+        """Test a page whose extraction raises maps to None without failing the batch"""
+        from aiohttp import web
+
+        async def handler(request):
+            return web.Response(text=ARTICLE_HTML, content_type='text/html')
+
+        def extract(html, url):
+            if url.endswith('/broken'):
+                raise ValueError("parser blew up")
+            return 'extracted text'
+
+        async def run():
+            app = web.Application()
+            app.router.add_get('/{name}', handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port = runner.addresses[0][1]
+            try:
+                urls = [f'http://127.0.0.1:{port}/broken', f'http://127.0.0.1:{port}/ok']
+                return urls, await self.scraper.fetch_many(urls, timeout=5)
+            finally:
+                await runner.cleanup()
+
+        # The SSRF guard rejects loopback addresses, so allow them for the test server
+        with patch('src.web_scraper.validate_url', side_effect=lambda url: url), \
+                patch.object(self.scraper, '_extract_content', side_effect=extract):
+            (broken_url, ok_url), result = asyncio.run(run())
+
+        self.assertEqual(result, {broken_url: None, ok_url: 'extracted text'})
+
+    @unittest.skipUnless(HAVE_AIOHTTP, "aiohttp not installed")
+    def test_fetch_many_survives_unknown_charset(self):
+        """Test a page declaring a bogus charset maps to None without failing the batch"""
+        from aiohttp import web
+
+        async def handler(request):
+            charset = 'bogus-enc' if request.path == '/bogus' else 'utf-8'
+            return web.Response(body=ARTICLE_HTML.encode('utf-8'),
+                                headers={'Content-Type': f'text/html; charset={charset}'})
+
+        async def run():
+            app = web.Application()
+            app.router.add_get('/{name}', handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port = runner.addresses[0][1]
+            try:
+                urls = [f'http://127.0.0.1:{port}/bogus', f'http://127.0.0.1:{port}/ok']
+                return urls, await self.scraper.fetch_many(urls, timeout=5)
+            finally:
+                await runner.cleanup()
+
+        # The SSRF guard rejects loopback addresses, so allow them for the test server
+        with patch('src.web_scraper.validate_url', side_effect=lambda url: url):
+            (bogus_url, ok_url), result = asyncio.run(run())
+
+        self.assertIsNone(result[bogus_url])
+        self.assertIn('Researchers released', result[ok_url])
+
+    @unittest.skipUnless(HAVE_AIOHTTP, "aiohttp not installed")
+    def test_fetch_many_concurrent(self):
+        """Test fetch_many downloads and extracts pages from a live server"""
+        from aiohttp import web
+
+        requests_seen = []
+
+        async def handler(request):
+            requests_seen.append(request.path)
+            if request.path == '/missing':
+                raise web.HTTPNotFound()
+            if request.headers.get('If-None-Match') == '"v1"':
+                return web.Response(status=304)
+            return web.Response(text=ARTICLE_HTML, content_type='text/html', headers={'ETag': '"v1"'})
+
+        async def run():
+            app = web.Application()
+            app.router.add_get('/{name}', handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port = runner.addresses[0][1]
+            try:
+                urls = [f'http://127.0.0.1:{port}/a', f'http://127.0.0.1:{port}/missing']
+                first = await self.scraper.fetch_many(urls, timeout=5)
+                second = await self.scraper.fetch_many(urls[:1], timeout=5)
+                return urls, first, second
+            finally:
+                await runner.cleanup()
+
+        # The SSRF guard rejects loopback addresses, so allow them for the test server
+        with patch('src.web_scraper.validate_url', side_effect=lambda url: url):
+            (ok_url, missing_url), first, second = asyncio.run(run())
+
+        self.assertIn('Researchers released', first[ok_url])
+        self.assertIsNone(first[missing_url])
+        # The repeat fetch revalidates with the cached ETag and reuses the text
+        self.assertEqual(second[ok_url], first[ok_url])
+        self.assertEqual(requests_seen.count('/a'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()